@@ -4,7 +4,7 @@ import subprocess
 from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
-from guardian.services.status import StatusChecker
+from guardian.services.status import StatusChecker, invalidate_status_cache
 from guardian.core.auth import AuthService
 
 console = Console()
@@ -49,6 +49,7 @@ def setup_github(ctx, token, name):
     
     service = AuthService()  # Create service instance
     result = service.setup_git_token(token, name)
+    invalidate_status_cache()
     
     if result.success:
         console.print(f"[green]✓ {result.message}[/green]")
@@ -74,6 +75,7 @@ def setup_ssh(ctx, email, force):
 
     # Call the setup method
     result = ctx.obj.auth.setup_ssh(email, force)
+    invalidate_status_cache()
 
     # Handle the result
     if result.success:
@@ -104,9 +106,10 @@ def setup_ssh(ctx, email, force):
 def status(ctx):
     """Check status of all authentication methods"""
     checker = StatusChecker(ctx.obj.config)  # Pass config service
+    statuses = checker.check_all(ctx.obj.auth.keyring)
     
     # Check SSH
-    ssh_status = checker.check_ssh()
+    ssh_status = statuses['ssh']
     console.print(Panel(
         "\n".join([
             "[bold]SSH Keys:[/bold]",
@@ -128,7 +131,7 @@ def status(ctx):
     ))
     
     # Check Git
-    git_status = checker.check_git()
+    git_status = statuses['git']
     console.print(Panel(
         "\n".join([
             "[bold]Git Configuration:[/bold]",
@@ -151,7 +154,7 @@ def status(ctx):
     ))
     
     # Check GitHub
-    github_status = checker.check_github(ctx.obj.auth.keyring)
+    github_status = statuses['github']
     console.print(Panel(
         "\n".join([
             "[bold]GitHub Configuration:[/bold]",
@@ -340,6 +343,8 @@ def setup_signing(ctx, name, email):
         console.print("\nTo remove incomplete setup:")
         console.print("  guardian config unset user.signingkey")
         console.print("  guardian config unset commit.gpgsign")
+    finally:
+        invalidate_status_cache()
 
 @auth.command()
 @click.option('--token', help='GitLab Personal Access Token')
@@ -367,6 +372,7 @@ def setup_gitlab(ctx, token):
                            hide_input=True, confirmation_prompt=True)
     
     result = ctx.obj.auth.setup_git_token(token, name='gitlab')
+    invalidate_status_cache()
     if result.success:
         console.print(f"[green]✓ {result.message}[/green]")
     else:
@@ -397,6 +403,7 @@ def setup_bitbucket(ctx, token):
                            hide_input=True, confirmation_prompt=True)
     
     result = ctx.obj.auth.setup_git_token(token, name='bitbucket')
+    invalidate_status_cache()
     if result.success:
         console.print(f"[green]✓ {result.message}[/green]")
     else:
@@ -4,6 +4,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 import subprocess
+from guardian.services.status import invalidate_status_cache
 
 console = Console()
 
@@ -46,6 +47,8 @@ def set(ctx, key, value):
         console.print(f"[red]✗[/red] Failed to update git config: {e.stderr}")
     except Exception as e:
         console.print(f"[red]✗[/red] Error: {str(e)}")
+    finally:
+        invalidate_status_cache()
 
 @config.command()
 @click.argument('key', required=False)
@@ -131,6 +134,8 @@ def unset(ctx, key):
                 console.print(f"[red]✗[/red] Failed to remove config: {result.message}")
     except Exception as e:
         console.print(f"[red]✗[/red] Error: {str(e)}")
+    finally:
+        invalidate_status_cache()
 
 @config.command()
 @click.pass_context
@@ -160,3 +165,5 @@ def init(ctx):
             console.print(f"[red]✗[/red] Failed to initialize config: {result.message}")
     except Exception as e:
         console.print(f"[red]✗[/red] Error: {str(e)}")
+    finally:
+        invalidate_status_cache()
@@ -1,6 +1,5 @@
 # src/guardian/cli/commands/keys.py
 import click
-import json
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -135,14 +134,9 @@ def usage(ctx, key_path):
 def alerts(ctx):
     """Show recent security alerts"""
     alert_system = KeyAlertSystem()
-    alert_history = Path(alert_system.alert_history)
-    
-    if not alert_history.exists():
-        console.print("No alerts recorded")
-        return
     
     try:
-        alerts = json.loads(alert_history.read_text())
+        alerts = alert_system.load_alerts()
         
         if not alerts:
             console.print("No alerts recorded")
@@ -187,20 +181,13 @@ def clear_alerts(ctx, level):
         return
     
     alert_system = KeyAlertSystem()
-    alert_history = Path(alert_system.alert_history)
-    
-    if not alert_history.exists():
-        console.print("No alerts to clear")
-        return
     
     try:
         if level == 'all':
-            alert_history.write_text('[]')
+            alert_system.clear_alerts()
             console.print("[green]✓[/green] All alerts cleared")
         else:
-            alerts = json.loads(alert_history.read_text())
-            alerts = [a for a in alerts if a['level'] != level]
-            alert_history.write_text(json.dumps(alerts, indent=2))
+            alert_system.clear_alerts(level)
             console.print(f"[green]✓[/green] {level.title()} alerts cleared")
     except Exception as e:
         console.print(f"[red]Error clearing alerts: {e}[/red]")
@@ -2,6 +2,7 @@
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 import logging
+import sys
 from pathlib import Path
 
 # Configure root logger
@@ -11,7 +12,12 @@ logging.basicConfig(level=logging.WARNING) # Change from DEBUG to WARNING
 for logger_name in ['guardian.services.keyring', 'keyring.backend']:
     logging.getLogger(logger_name).setLevel(logging.WARNING)
 
-@dataclass
+# Pass to @dataclass to drop the per-instance __dict__ of records created in
+# bulk; slots=True needs Python 3.10, older versions keep the __dict__
+DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Every service call returns a Result
+@dataclass(**DATACLASS_SLOTS)
 class Result:
     success: bool
     message: str
@@ -30,10 +36,10 @@ class Service:
                      error: Optional[Exception] = None) -> Result:
         """Create a standardized result object"""
         if error:
-            self.logger.error(f"{message}: {str(error)}")
+            self.logger.error("%s: %s", message, error)
         elif not success:
             self.logger.warning(message)
         else:
             self.logger.info(message)
         
-        return Result(success=success, message=message, data=data, error=error)
+        return Result(success, message, data, error)
@@ -8,6 +8,7 @@ from guardian.services.ssh import SSHManager
 from guardian.services.gpg import GPGManager
 from guardian.services.keyring import KeyringManager
 from guardian.services.api import GitHubAPI
+from guardian.services.status import invalidate_status_cache
 from datetime import datetime, timezone
 
 class AuthService(Service):
@@ -51,6 +52,7 @@ class AuthService(Service):
         """Setup SSH authentication"""
         try:
             key_path = self.ssh.generate_key(email, force)
+            invalidate_status_cache()
             return self.create_result(
                 success=True,
                 message="SSH key generated successfully",
@@ -152,10 +154,13 @@ class AuthService(Service):
             auth_config = self.config.get('auth', {})
             github_tokens = auth_config.get('github_tokens', [])
             
-            tokens = []
-            for token_name in github_tokens:
-                if self.keyring.get_credential(f"github_token_{token_name}"):
-                    tokens.append(token_name)
+            values = self.keyring.get_credentials(
+                [f"github_token_{token_name}" for token_name in github_tokens]
+            )
+            tokens = [
+                token_name for token_name in github_tokens
+                if values[f"github_token_{token_name}"]
+            ]
             
             return self.create_result(
                 True,
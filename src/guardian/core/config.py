@@ -3,6 +3,7 @@ import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from guardian.core import Service, Result
+from guardian.services.status import invalidate_status_cache
 
 class ConfigService(Service):
     """Core configuration management service"""
@@ -41,6 +42,7 @@ class ConfigService(Service):
         self.config_dir.mkdir(exist_ok=True)
         with open(self.config_file, 'w') as f:
             yaml.safe_dump(config, f)
+        invalidate_status_cache()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
@@ -4,6 +4,11 @@ import subprocess
 from typing import List, Optional
 from guardian.core import Service, Result
 
+try:
+    import pygit2  # Optional: in-process git init
+except ImportError:
+    pygit2 = None
+
 class RepoService(Service):
     """Core repository management service"""
     def __init__(self):
@@ -17,8 +22,11 @@ class RepoService(Service):
             path = Path(path).resolve()
             path.mkdir(exist_ok=True)
             
-            # Initialize git repository
-            subprocess.run(['git', 'init'], cwd=path, check=True)
+            # Initialize git repository, in-process when libgit2 is available
+            if pygit2 is not None:
+                pygit2.init_repository(str(path), bare=False)
+            else:
+                subprocess.run(['git', 'init'], cwd=path, check=True)
             
             if template:
                 template_path = self.templates_dir / template
@@ -1,12 +1,27 @@
 # src/guardian/services/alerts.py
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 from pathlib import Path
+import atexit
 import json
-from guardian.core import Service, Result
+import mmap
+import os
+import time
+import weakref
+from guardian.core import DATACLASS_SLOTS, Service, Result
 
-@dataclass
+# Alert systems with buffered alerts to flush at exit. Weak, so the single
+# atexit hook doesn't keep every instance alive.
+_open_systems: "weakref.WeakSet[KeyAlertSystem]" = weakref.WeakSet()
+
+@atexit.register
+def _close_all():
+    for system in list(_open_systems):
+        system.close()
+
+@dataclass(**DATACLASS_SLOTS)
 class Alert:
     """Security alert information"""
     level: str  # 'info', 'warning', 'critical'
@@ -18,30 +33,72 @@ class Alert:
 class KeyAlertSystem(Service):
     """Alert system for SSH key usage"""
     
+    HISTORY_LIMIT = 100     # Alerts kept on disk
+    FLUSH_SIZE = 50         # Buffered alerts that force a flush
+    FLUSH_INTERVAL = 30     # Seconds between flushes
+    RAPID_USE_LIMIT = 5     # Uses in 5 minutes before alerting
+    FAILURE_LIMIT = 3       # Failures before alerting
+    
     def __init__(self):
         super().__init__()
-        self.alert_history = self.config_dir / 'alerts.json'
+        self.alert_history = self.config_dir / 'alerts.jsonl'
+        self._buffer: deque = deque(maxlen=self.HISTORY_LIMIT)
+        self._last_flush = time.monotonic()
+        self._appended = 0
+        # key path -> known hosts, built once per key by _is_known_host
+        self._known_hosts: Dict[Path, Set[str]] = {}
+        self._fd: Optional[int] = None  # O_APPEND descriptor, opened on first flush
         self._init_alert_store()
+        _open_systems.add(self)
     
     def _init_alert_store(self):
-        """Initialize alert storage"""
-        if not self.alert_history.exists():
-            self.alert_history.write_text('[]')
+        """Initialize alert storage, importing the old alerts.json once"""
+        legacy = self.config_dir / 'alerts.json'
+        if legacy.exists():
+            self._import_legacy_history(legacy)
+        self.alert_history.touch(exist_ok=True)
+    
+    def _import_legacy_history(self, legacy: Path):
+        """Move alerts from the JSON array file into the history log"""
+        # Claim the file first so concurrent processes import it only once
+        claimed = legacy.with_suffix('.json.importing')
+        try:
+            os.rename(legacy, claimed)
+        except OSError:
+            return
+        try:
+            alerts = json.loads(claimed.read_text())
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not import {legacy}: {e}")
+            os.replace(claimed, legacy.with_suffix('.json.bak'))
+            return
+        try:
+            current = self.alert_history.read_text()
+        except FileNotFoundError:
+            current = ''
+        # The old alerts predate anything already in the log
+        self._rewrite_history(''.join(
+            json.dumps(a, separators=(',', ':')) + '\n'
+            for a in alerts[-self.HISTORY_LIMIT:]
+        ) + current)
+        claimed.unlink()
     
     def check_key_usage(self, key_path: Path, usage_data: Dict) -> Result:
         """Check for suspicious key usage patterns"""
         alerts = []
+        now = datetime.now()
+        recent_count, failure_hosts = self._scan_recent_uses(usage_data, now)
         
         # Check usage timing
-        if timing_alert := self._check_timing(usage_data):
+        if timing_alert := self._check_timing(recent_count, now):
             alerts.append(timing_alert)
         
         # Check access patterns
-        if pattern_alert := self._check_patterns(usage_data):
+        if pattern_alert := self._check_patterns(failure_hosts, now):
             alerts.append(pattern_alert)
         
         # Check locations
-        if location_alert := self._check_locations(usage_data):
+        if location_alert := self._check_locations(key_path, usage_data, now):
             alerts.append(location_alert)
         
         # Store alerts if any found
@@ -50,7 +107,7 @@ class KeyAlertSystem(Service):
             return self.create_result(
                 True,
                 "Security alerts detected",
-                {'alerts': [a.__dict__ for a in alerts]}
+                {'alerts': [asdict(a) for a in alerts]}
             )
         
         return self.create_result(
@@ -58,16 +115,29 @@ class KeyAlertSystem(Service):
             "No security concerns detected"
         )
     
-    def _check_timing(self, usage_data: Dict) -> Optional[Alert]:
+    def _scan_recent_uses(self, usage_data: Dict,
+                          now: datetime) -> Tuple[int, List[str]]:
+        """Count recent uses and collect failing hosts in one pass"""
+        cutoff = now - timedelta(minutes=5)
+        recent_count = 0
+        failure_hosts = []
+        for use in usage_data.get('recent_uses', ()):
+            if use['timestamp'] > cutoff:
+                recent_count += 1
+            if not use.get('success', True):
+                failure_hosts.append(use['host'])
+        return recent_count, failure_hosts
+    
+    def _check_timing(self, recent_count: int, now: datetime) -> Optional[Alert]:
         """Check for suspicious timing patterns"""
-        current_hour = datetime.now().hour
+        current_hour = now.hour
         
         # Night time usage (configurable)
         if 0 <= current_hour <= 5:
             return Alert(
                 level='warning',
                 message="Key usage during unusual hours",
-                timestamp=datetime.now(),
+                timestamp=now,
                 details={
                     'hour': current_hour,
                     'normal_hours': '6:00-23:00'
@@ -79,17 +149,13 @@ class KeyAlertSystem(Service):
             )
         
         # Rapid successive uses
-        recent_uses = [
-            u for u in usage_data.get('recent_uses', [])
-            if datetime.now() - u['timestamp'] < timedelta(minutes=5)
-        ]
-        if len(recent_uses) > 5:  # More than 5 uses in 5 minutes
+        if recent_count > self.RAPID_USE_LIMIT:
             return Alert(
                 level='critical',
                 message="Unusually rapid key usage detected",
-                timestamp=datetime.now(),
+                timestamp=now,
                 details={
-                    'uses_count': len(recent_uses),
+                    'uses_count': recent_count,
                     'timeframe': '5 minutes'
                 },
                 recommendations=[
@@ -101,21 +167,18 @@ class KeyAlertSystem(Service):
         
         return None
     
-    def _check_patterns(self, usage_data: Dict) -> Optional[Alert]:
+    def _check_patterns(self, failure_hosts: List[str],
+                        now: datetime) -> Optional[Alert]:
         """Check for suspicious usage patterns"""
         # Check for failed attempts
-        recent_failures = [
-            u for u in usage_data.get('recent_uses', [])
-            if not u.get('success', True)
-        ]
-        if len(recent_failures) >= 3:  # 3 or more failures
+        if len(failure_hosts) >= self.FAILURE_LIMIT:
             return Alert(
                 level='critical',
                 message="Multiple authentication failures detected",
-                timestamp=datetime.now(),
+                timestamp=now,
                 details={
-                    'failure_count': len(recent_failures),
-                    'hosts': [f['host'] for f in recent_failures]
+                    'failure_count': len(failure_hosts),
+                    'hosts': failure_hosts
                 },
                 recommendations=[
                     "Check for potential brute force attempts",
@@ -126,16 +189,19 @@ class KeyAlertSystem(Service):
         
         return None
     
-    def _check_locations(self, usage_data: Dict) -> Optional[Alert]:
+    def _check_locations(self, key_path: Path, usage_data: Dict,
+                         now: datetime) -> Optional[Alert]:
         """Check for suspicious access locations"""
-        known_hosts = set(usage_data.get('known_hosts', []))
         current_host = usage_data.get('current_host')
+        if not current_host:
+            return None
         
-        if current_host and current_host not in known_hosts:
+        known_hosts = usage_data.get('known_hosts', ())
+        if not self._is_known_host(key_path, current_host, known_hosts):
             return Alert(
                 level='warning',
                 message="Access from new location detected",
-                timestamp=datetime.now(),
+                timestamp=now,
                 details={
                     'new_host': current_host,
                     'known_hosts': list(known_hosts)
@@ -149,61 +215,211 @@ class KeyAlertSystem(Service):
         
         return None
     
+    def _is_known_host(self, key_path: Path, host: str, known_hosts) -> bool:
+        """Check a host against the set kept for this key
+        
+        The set is built from the caller's list the first time a key is
+        checked; only a miss reads the list again, to pick up hosts added
+        since. Like the key tracker's, known hosts are never removed.
+        """
+        hosts = self._known_hosts.get(key_path)
+        if hosts is None or host not in hosts:
+            hosts = self._known_hosts[key_path] = set(known_hosts)
+        return host in hosts
+    
     def _store_alerts(self, alerts: List[Alert]):
-        """Store alerts in history"""
-        try:
-            existing = json.loads(self.alert_history.read_text())
-        except:
-            existing = []
-        
-        # Add new alerts
-        existing.extend([
-            {
-                'level': alert.level,
-                'message': alert.message,
-                'timestamp': alert.timestamp.isoformat(),
-                'details': alert.details,
-                'recommendations': alert.recommendations
-            }
+        """Queue alerts for the history log"""
+        self._buffer.extend(
+            {**asdict(alert), 'timestamp': alert.timestamp.isoformat()}
             for alert in alerts
-        ])
+        )
+        # A crash must not lose a critical alert still sitting in the buffer
+        if any(alert.level == 'critical' for alert in alerts):
+            self._flush()
+        else:
+            self._maybe_flush()
+    
+    def _maybe_flush(self):
+        """Flush buffered alerts once enough are queued or time has passed"""
+        if (len(self._buffer) >= self.FLUSH_SIZE or
+                time.monotonic() - self._last_flush > self.FLUSH_INTERVAL):
+            self._flush()
+    
+    def _flush(self):
+        """Append buffered alerts to the history log"""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        
+        try:
+            # Another instance or process may have trimmed or replaced the log
+            if self._fd is not None and not self._fd_is_current():
+                self._close_fd()
+            if self._fd is None:
+                self._fd = os.open(
+                    self.alert_history,
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                    0o600
+                )
+            os.write(self._fd, ''.join(
+                json.dumps(alert, separators=(',', ':')) + '\n'
+                for alert in self._buffer
+            ).encode())
+            self._appended += len(self._buffer)
+            self._buffer.clear()
+            
+            # Trim lazily rather than rewriting the log on every flush
+            if self._appended >= self.HISTORY_LIMIT:
+                self._trim_history()
+        except Exception as e:
+            self.logger.error(f"Failed to store alerts: {e}")
+    
+    def _trim_history(self):
+        """Keep only the most recent alerts in the history log"""
+        recent = self._tail_lines(self.HISTORY_LIMIT)
+        self._rewrite_history(''.join(line.decode() + '\n' for line in recent))
+    
+    def _tail_lines(self, limit: int) -> List[bytes]:
+        """Return the last `limit` lines of the history log
         
-        # Keep last 100 alerts
-        existing = existing[-100:]
-        self.alert_history.write_text(json.dumps(existing, indent=2))
+        Walks newlines backwards through an mmap of the file, so only the
+        tail is touched regardless of how large the log has grown.
+        """
+        with open(self.alert_history, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = len(mm)
+                if mm[end - 1] == ord('\n'):
+                    end -= 1
+                start = end
+                for _ in range(limit):
+                    start = mm.rfind(b'\n', 0, start)
+                    if start < 0:
+                        break
+                tail = mm[start + 1:end]
+        return tail.split(b'\n') if tail else []
+    
+    def _rewrite_history(self, content: str):
+        """Atomically replace the history log so readers never see a torn file"""
+        tmp = self.alert_history.with_suffix('.jsonl.tmp')
+        tmp.write_text(content)
+        os.replace(tmp, self.alert_history)
+        # The append descriptor still points at the replaced file
+        self._close_fd()
+        self._appended = 0
+    
+    def _fd_is_current(self) -> bool:
+        """Whether the append descriptor still refers to the history log"""
+        try:
+            st = os.stat(self.alert_history)
+        except FileNotFoundError:
+            return False
+        fst = os.fstat(self._fd)
+        return (st.st_ino, st.st_dev) == (fst.st_ino, fst.st_dev)
+    
+    def _close_fd(self):
+        """Close the append descriptor if open"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+    
+    def close(self):
+        """Flush pending alerts and sync the history log to disk"""
+        self._flush()
+        if self._fd is not None:
+            try:
+                os.fsync(self._fd)
+            except OSError:
+                pass
+            self._close_fd()
+    
+    def load_alerts(self) -> List[Dict]:
+        """Load the most recent stored alerts"""
+        self._flush()
+        alerts = []
+        for line in self._tail_lines(self.HISTORY_LIMIT):
+            try:
+                alerts.append(json.loads(line))
+            except ValueError:
+                continue
+        return alerts
+    
+    def clear_alerts(self, level: Optional[str] = None):
+        """Remove stored alerts, optionally only those of one level"""
+        if level is None:
+            self._buffer.clear()
+            self._rewrite_history('')
+        else:
+            alerts = [a for a in self.load_alerts() if a['level'] != level]
+            self._rewrite_history(''.join(
+                json.dumps(a, separators=(',', ':')) + '\n' for a in alerts
+            ))
 
 class AlertNotifier(Service):
     """Handle alert notifications"""
     
+    PANEL_TEMPLATE = (
+        "[bold red]Security Alert (%s)[/bold red]\n"
+        "Message: %s\n"
+        "Time: %s\n"
+        "\n"
+        "[bold]Details:[/bold]\n"
+        "%s\n"
+        "\n"
+        "[bold]Recommendations:[/bold]\n"
+        "%s"
+    )
+    
+    # notify2 module once initialised, False if unavailable, None if untried
+    _notify2 = None
+    
+    def __init__(self):
+        super().__init__()
+        self._console = None
+    
+    @classmethod
+    def _system_notifier(cls):
+        """Import and initialise notify2 once per process"""
+        if cls._notify2 is None:
+            try:
+                import notify2
+                notify2.init('Guardian')
+                cls._notify2 = notify2
+            except Exception:
+                # Missing module or no DBus session; don't retry
+                cls._notify2 = False
+        return cls._notify2
+    
     def notify(self, alert: Alert) -> Result:
         """Send alert notification"""
+        from rich.panel import Panel
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        
         # Terminal notification
-        self.console.print(Panel(
-            "\n".join([
-                f"[bold red]Security Alert ({alert.level.upper()})[/bold red]",
-                f"Message: {alert.message}",
-                f"Time: {alert.timestamp}",
-                "",
-                "[bold]Details:[/bold]",
-                *[f"• {k}: {v}" for k, v in alert.details.items()],
-                "",
-                "[bold]Recommendations:[/bold]",
-                *[f"• {r}" for r in alert.recommendations]
-            ]),
+        self._console.print(Panel(
+            self.PANEL_TEMPLATE % (
+                alert.level.upper(),
+                alert.message,
+                alert.timestamp,
+                "\n".join(f"• {k}: {v}" for k, v in alert.details.items()),
+                "\n".join(f"• {r}" for r in alert.recommendations)
+            ),
             title="Guardian Security Alert",
             style="red"
         ))
         
         # System notification (if available)
-        try:
-            import notify2
-            notify2.init('Guardian')
-            notification = notify2.Notification(
-                "Guardian Security Alert",
-                f"{alert.level.upper()}: {alert.message}"
-            )
-            notification.show()
-        except ImportError:
-            pass
+        notify2 = self._system_notifier()
+        if notify2:
+            try:
+                notify2.Notification(
+                    "Guardian Security Alert",
+                    f"{alert.level.upper()}: {alert.message}"
+                ).show()
+            except Exception as e:
+                self.logger.debug(f"System notification failed: {e}")
         
         return self.create_result(True, "Alert notification sent")
@@ -1,10 +1,52 @@
 # src/guardian/services/api/__init__.py
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Mapping, Tuple
+from types import MappingProxyType
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from datetime import datetime, timezone
-import jwt  # For JWT token parsing
+
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
+
+# Map OAuth scopes to human-readable capabilities
+_CAPABILITY_MAP: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'repo': (
+        'Access private repositories',
+        'Clone and push code',
+        'Manage repository settings'
+    ),
+    'read:org': (
+        'View organization membership',
+        'Read team information'
+    ),
+    'admin:public_key': (
+        'Manage SSH keys',
+        'Configure deploy keys'
+    ),
+    'gist': (
+        'Create and manage gists',
+    ),
+    'notifications': (
+        'Access notifications',
+        'Mark as read'
+    ),
+    'delete_repo': (
+        'Delete repositories',
+    )
+    # Add more scope mappings as needed
+})
+_CAPABILITY_KEYS = frozenset(_CAPABILITY_MAP)
+
+def parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 @dataclass
 class TokenInfo:
@@ -65,21 +107,35 @@ class GitHubAPI(GitPlatformAPI):
         5. Token expiration (if applicable)
         """
         try:
-            # Check basic authentication
-            user_response = self.session.get(f"{self.base_url}/user")
-            user_response.raise_for_status()
-            user_data = user_response.json()
-            
-            # Get rate limit information
-            rate_limit = self.session.get(f"{self.base_url}/rate_limit")
-            rate_limit_data = rate_limit.json()
+            # The three lookups are independent, so issue them concurrently
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                # Check basic authentication
+                user_future = pool.submit(self.session.get, f"{self.base_url}/user")
+                
+                # Get rate limit information
+                rate_limit_future = pool.submit(
+                    self.session.get, f"{self.base_url}/rate_limit"
+                )
+                
+                # Get token metadata (requires preview header)
+                token_future = pool.submit(
+                    self.session.get,
+                    f"{self.base_url}/applications/token",
+                    headers={'Accept': 'application/vnd.github.v3+json'}
+                )
+                
+                user_response = user_future.result()
+                rate_limit = rate_limit_future.result()
+                token_response = token_future.result()
             
-            # Get token metadata (requires preview header)
-            token_response = self.session.get(
-                f"{self.base_url}/applications/token",
-                headers={'Accept': 'application/vnd.github.v3+json'}
+            user_response.raise_for_status()
+            user_data = parse_json(user_response)
+            rate_limit_data = parse_json(rate_limit)
+            # Metadata is optional; skip parsing when there is nothing to read
+            token_data = (
+                parse_json(token_response)
+                if token_response.ok and token_response.content else {}
             )
-            token_data = token_response.json() if token_response.ok else {}
             
             # Parse scopes
             scopes = user_response.headers.get('X-OAuth-Scopes', '').split(',')
@@ -87,8 +143,8 @@ class GitHubAPI(GitPlatformAPI):
             
             # Check expiration
             expires_at = None
-            if 'exp' in token_data:
-                expires_at = datetime.fromtimestamp(token_data['exp'], timezone.utc)
+            if (exp := token_data.get('exp')) is not None:
+                expires_at = datetime.fromtimestamp(exp, timezone.utc)
             
             # Map scopes to capabilities
             capabilities = self._get_capabilities(scopes)
@@ -122,38 +178,10 @@ class GitHubAPI(GitPlatformAPI):
     
     def _get_capabilities(self, scopes: List[str]) -> List[str]:
         """Map OAuth scopes to human-readable capabilities"""
-        capability_map = {
-            'repo': [
-                'Access private repositories',
-                'Clone and push code',
-                'Manage repository settings'
-            ],
-            'read:org': [
-                'View organization membership',
-                'Read team information'
-            ],
-            'admin:public_key': [
-                'Manage SSH keys',
-                'Configure deploy keys'
-            ],
-            'gist': [
-                'Create and manage gists'
-            ],
-            'notifications': [
-                'Access notifications',
-                'Mark as read'
-            ],
-            'delete_repo': [
-                'Delete repositories'
-            ]
-            # Add more scope mappings as needed
-        }
-        
-        capabilities = []
-        for scope in scopes:
-            if scope in capability_map:
-                capabilities.extend(capability_map[scope])
-        return capabilities
+        # Walk scopes in order so capabilities are listed deterministically
+        return list(chain.from_iterable(
+            _CAPABILITY_MAP[scope] for scope in scopes if scope in _CAPABILITY_KEYS
+        ))
     
     def get_user(self) -> Dict[str, Any]:
         """Get authenticated user information"""
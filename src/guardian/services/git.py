@@ -1,44 +1,100 @@
 # src/guardian/services/git.py
 import subprocess
 from pathlib import Path
-from typing import Optional, Dict, Literal
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Optional, Dict, List, Literal, Sequence, Tuple
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from guardian.core import Service, Result
+from guardian.services.api import parse_json
+
+try:
+    import pygit2  # Optional: in-process git lookups
+except ImportError:
+    pygit2 = None
 
 PlatformType = Literal['github', 'gitlab', 'bitbucket']
 
+PLATFORM_HOSTS = MappingProxyType({
+    'github': r'github\.com',
+    'gitlab': r'gitlab\.com',
+    'bitbucket': r'bitbucket\.org'
+})
+
+# One alternation for all platforms; the named groups that matched tell
+# us which platform the URL belongs to
+_PLATFORM_RE = re.compile('|'.join(
+    rf'(?:https://{host}/|git@{host}:)'
+    rf'(?P<{platform}_owner>[^/]+)/(?P<{platform}_repo>[^/.]+)(?:\.git)?'
+    for platform, host in PLATFORM_HOSTS.items()
+))
+
 class GitService(Service):
     """Git operations and status checking"""
     
-    PLATFORM_PATTERNS = {
-        'github': (
-            r'(?:https://github\.com/|git@github\.com:)([^/]+)/([^/.]+)(?:\.git)?'
-        ),
-        'gitlab': (
-            r'(?:https://gitlab\.com/|git@gitlab\.com:)([^/]+)/([^/.]+)(?:\.git)?'
-        ),
-        'bitbucket': (
-            r'(?:https://bitbucket\.org/|git@bitbucket\.org:)([^/]+)/([^/.]+)(?:\.git)?'
-        )
-    }
-    
-    API_URLS = {
+    API_URLS = MappingProxyType({
         'github': 'https://api.github.com',
         'gitlab': 'https://gitlab.com/api/v4',
         'bitbucket': 'https://api.bitbucket.org/2.0'
-    }
+    })
+    
+    REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+    MAX_CONCURRENT_REQUESTS = 16  # Matches the session's pool size
+
+    def __init__(self):
+        super().__init__()
+        # Keep-alive session so repeated API calls reuse TLS connections
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(429, 502, 503, 504)
+            )
+        ))
+        self._repo_cache: Dict[Path, 'pygit2.Repository'] = {}
+
+    def _open_repo(self, path: Path) -> Optional['pygit2.Repository']:
+        """Open (and cache) the repository containing path via libgit2"""
+        if pygit2 is None:
+            return None
+        path = Path(path).resolve()
+        if path not in self._repo_cache:
+            repo_path = pygit2.discover_repository(str(path))
+            if repo_path is None:
+                return None
+            self._repo_cache[path] = pygit2.Repository(repo_path)
+        return self._repo_cache[path]
 
     def detect_platform(self, remote_url: str) -> Optional[tuple[str, str, str]]:
         """Detect git platform and extract owner/repo"""
-        for platform, pattern in self.PLATFORM_PATTERNS.items():
-            match = re.match(pattern, remote_url)
-            if match:
-                return platform, match.group(1), match.group(2)
+        match = _PLATFORM_RE.match(remote_url)
+        if not match:
+            return None
+        groups = match.groupdict()
+        for platform in PLATFORM_HOSTS:
+            if groups[f'{platform}_owner']:
+                return platform, groups[f'{platform}_owner'], groups[f'{platform}_repo']
         return None
 
     def get_current_branch(self, path: Path = Path('.')) -> Result:
         """Get current branch name"""
+        try:
+            repo = self._open_repo(path)
+            if repo is not None:
+                return self.create_result(
+                    True,
+                    "Branch found",
+                    {'branch': repo.head.shorthand}
+                )
+        except pygit2.GitError:
+            pass  # e.g. unborn branch; let the git CLI decide
+
         try:
             result = subprocess.run(
                 ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
@@ -58,16 +114,27 @@ class GitService(Service):
                 "Not a git repository or no branch found"
             )
 
+    def _get_origin_url(self, path: Path) -> str:
+        """Get the origin URL, raising CalledProcessError if there is none"""
+        try:
+            repo = self._open_repo(path)
+            if repo is not None:
+                return repo.remotes['origin'].url
+        except (KeyError, pygit2.GitError):
+            pass
+
+        return subprocess.run(
+            ['git', 'remote', 'get-url', 'origin'],
+            cwd=path,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+
     def check_remote(self, path: Path = Path('.')) -> Result:
         """Check remote repository details"""
         try:
-            remote_url = subprocess.run(
-                ['git', 'remote', 'get-url', 'origin'],
-                cwd=path,
-                capture_output=True,
-                text=True,
-                check=True
-            ).stdout.strip()
+            remote_url = self._get_origin_url(path)
 
             platform_info = self.detect_platform(remote_url)
             if platform_info:
@@ -123,10 +190,14 @@ class GitService(Service):
                     f"Unsupported platform: {platform}"
                 )
 
-            response = requests.get(url, headers=headers)
+            response = self._session.get(
+                url,
+                headers=headers,
+                timeout=self.REQUEST_TIMEOUT
+            )
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 
                 # Platform-specific data parsing
                 if platform == 'github':
@@ -181,3 +252,15 @@ class GitService(Service):
                 f"Failed to verify repository: {str(e)}",
                 error=e
             )
+
+    def verify_repos(self, specs: Sequence[Tuple[str, str, str, str]]) -> List[Result]:
+        """Verify several repositories concurrently
+        
+        Each spec is a (platform, token, owner, repo) tuple; results are
+        returned in the same order.
+        """
+        if not specs:
+            return []
+        workers = min(len(specs), self.MAX_CONCURRENT_REQUESTS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda spec: self.verify_repo(*spec), specs))
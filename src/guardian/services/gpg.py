@@ -1,9 +1,19 @@
 # src/guardian/services/gpg.py
 from pathlib import Path
+import io
+import re
+import shutil
 import subprocess
-from typing import Optional, List
+from typing import BinaryIO, Optional, List
 from guardian.core import Service, Result
 
+_COLON_ESCAPE = re.compile(r'\\x([0-9a-fA-F]{2})')
+_UID_RE = re.compile(rb'^(?P<name>.*?) <(?P<email>[^>]+)>$')
+
+def _unescape_colon_field(value: str) -> str:
+    """Decode the \\xNN escapes gpg uses in --with-colons fields"""
+    return _COLON_ESCAPE.sub(lambda m: chr(int(m.group(1), 16)), value)
+
 class GPGManager(Service):
     """GPG key management service"""
     def __init__(self):
@@ -36,9 +46,9 @@ class GPGManager(Service):
             config_path.write_text(batch_config)
             config_path.chmod(0o600)
             
-            # Generate key
-            subprocess.run(
-                ['gpg', '--batch', '--gen-key', str(config_path)],
+            # Generate key, reporting the new fingerprint on the status fd
+            result = subprocess.run(
+                ['gpg', '--batch', '--status-fd=2', '--gen-key', str(config_path)],
                 check=True,
                 capture_output=True,
                 text=True
@@ -47,19 +57,11 @@ class GPGManager(Service):
             # Clean up
             config_path.unlink()
             
-            # Get the key ID
-            result = subprocess.run(
-                ['gpg', '--list-secret-keys', '--keyid-format', 'LONG', email],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            
-            # Extract key ID from output
+            # Long key ID is the last 16 hex digits of the fingerprint
             key_id = None
-            for line in result.stdout.splitlines():
-                if line.startswith('sec'):
-                    key_id = line.split('/')[1].split(' ')[0]
+            for line in result.stderr.splitlines():
+                if line.startswith('[GNUPG:] KEY_CREATED'):
+                    key_id = line.split()[-1][-16:]
                     break
             
             return self.create_result(
@@ -78,32 +80,36 @@ class GPGManager(Service):
     def list_keys(self) -> List[dict]:
         """List all GPG keys"""
         try:
-            result = subprocess.run(
-                ['gpg', '--list-secret-keys', '--keyid-format', 'LONG'],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            
+            cmd = ['gpg', '--batch', '--with-colons', '--list-secret-keys']
             keys = []
             current_key = {}
             
-            for line in result.stdout.splitlines():
-                if line.startswith('sec'):
-                    if current_key:
-                        keys.append(current_key)
-                    current_key = {'type': 'sec'}
-                    key_parts = line.split('/')
-                    if len(key_parts) > 1:
-                        current_key['key_id'] = key_parts[1].split(' ')[0]
-                elif line.startswith('uid'):
-                    uid_parts = line.split('] ')[1].split(' <')
-                    current_key['name'] = uid_parts[0]
-                    current_key['email'] = uid_parts[1].rstrip('>')
+            # Stream the listing and only decode the fields we keep
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            ) as proc:
+                for line in proc.stdout:
+                    fields = line.split(b':')
+                    if fields[0] == b'sec':
+                        if current_key:
+                            keys.append(current_key)
+                        current_key = {'type': 'sec', 'key_id': fields[4].decode('ascii')}
+                    elif fields[0] == b'fpr' and current_key and 'fingerprint' not in current_key:
+                        current_key['fingerprint'] = fields[9].decode('ascii')
+                    elif fields[0] == b'uid' and current_key and 'name' not in current_key:
+                        match = _UID_RE.match(fields[9])
+                        name, email = match.group('name', 'email') if match else (fields[9], b'')
+                        current_key['name'] = _unescape_colon_field(name.decode('utf-8', 'replace'))
+                        current_key['email'] = _unescape_colon_field(email.decode('utf-8', 'replace'))
+            
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, cmd)
             
             if current_key:
                 keys.append(current_key)
-                
+            
             return keys
             
         except subprocess.CalledProcessError:
@@ -111,30 +117,61 @@ class GPGManager(Service):
 
     def export_public_key(self, key_id: str) -> Optional[str]:
         """Export public key"""
+        buffer = io.BytesIO()
+        if not self.export_public_key_to(key_id, buffer):
+            return None
+        return buffer.getvalue().decode()
+
+    def export_public_key_to(self, key_id: str, dest: BinaryIO) -> bool:
+        """Stream an armored public key straight into a binary file object"""
+        cmd = ['gpg', '--armor', '--export', key_id]
         try:
-            result = subprocess.run(
-                ['gpg', '--armor', '--export', key_id],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            return result.stdout
+            try:
+                fd = dest.fileno()
+            except (AttributeError, io.UnsupportedOperation):
+                fd = None
+
+            if fd is not None:
+                # Real file or socket: let gpg write to it directly
+                dest.flush()
+                subprocess.run(cmd, stdout=fd, stderr=subprocess.DEVNULL, check=True)
+                return True
+
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            ) as proc:
+                shutil.copyfileobj(proc.stdout, dest)
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, cmd)
+            return True
         except subprocess.CalledProcessError:
-            return None
+            return False
+
+    def _resolve_fingerprint(self, key_id: str) -> str:
+        """Map a key ID to its fingerprint using the (cached) key listing"""
+        key_id = key_id.upper()
+        for key in self.list_keys():
+            fingerprint = key.get('fingerprint', '')
+            if fingerprint and fingerprint.endswith(key_id):
+                return fingerprint
+        return key_id
 
     def delete_key(self, key_id: str, secret: bool = True) -> Result:
         """Delete a GPG key"""
         try:
-            if secret:
-                subprocess.run(
-                    ['gpg', '--delete-secret-key', key_id],
-                    check=True,
-                    input=b'y\ny\n'
-                )
+            # Batch deletion only accepts a full fingerprint
+            fingerprint = self._resolve_fingerprint(key_id)
             subprocess.run(
-                ['gpg', '--delete-key', key_id],
+                [
+                    'gpg', '--batch', '--yes',
+                    '--delete-secret-and-public-key' if secret else '--delete-key',
+                    fingerprint
+                ],
                 check=True,
-                input=b'y\n'
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
             return self.create_result(True, "GPG key deleted successfully")
         except subprocess.CalledProcessError as e:
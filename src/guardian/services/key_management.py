@@ -1,12 +1,58 @@
 # src/guardian/services/key_management.py
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import BinaryIO, Iterable, Iterator, List, Dict, Optional, Tuple
+import gzip
+import io
+import os
 import subprocess
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 import json
 import shutil
 from guardian.core import Service, Result
+from guardian.services.ssh import read_key_info
+
+RECOVERY_INSTRUCTIONS = """\
+Guardian recovery bundle
+
+ssh/        SSH keys and config from ~/.ssh
+guardian/   Guardian configuration from ~/.guardian
+
+To restore:
+1. Copy ssh/* into ~/.ssh and run: chmod 600 ~/.ssh/id_*; chmod 644 ~/.ssh/id_*.pub
+2. Copy guardian/config.yml to ~/.guardian/config.yml
+"""
+
+@lru_cache(maxsize=64)
+def _static_health(path_str: str, mtime_ns: int,
+                   mode: int) -> Tuple[str, int, bool, Tuple[str, ...]]:
+    """Health checks that only change with the key's content or mode
+    
+    mtime and mode are part of the cache key, so rotating a key or fixing
+    its permissions produces a fresh entry.
+    """
+    recommendations = []
+    
+    # Check algorithm and size
+    key_info = read_key_info(Path(path_str))
+    if key_info['algorithm'] in KeyManager.WEAK_ALGORITHMS:
+        recommendations.append(f"Using weak algorithm: {key_info['algorithm']}")
+    if key_info['algorithm'] == 'rsa' and key_info['size'] < 3072:
+        recommendations.append("RSA key size should be at least 3072 bits")
+    
+    # Check permissions: public keys 644, private keys 600
+    permissions = mode & 0o777
+    expected = 0o644 if path_str.endswith('.pub') else 0o600
+    permissions_ok = permissions == expected
+    if not permissions_ok:
+        recommendations.append(f"Incorrect permissions: {permissions:o}")
+    
+    return (key_info['algorithm'], key_info['size'], permissions_ok,
+            tuple(recommendations))
 
 @dataclass
 class KeyHealth:
@@ -34,39 +80,34 @@ class KeyManager(Service):
     def check_key_health(self, key_path: Path) -> Result:
         """Check health of an SSH key"""
         try:
-            if not key_path.exists():
+            # One stat serves the existence, age and permission checks
+            try:
+                st = key_path.stat()
+            except FileNotFoundError:
                 return self.create_result(
                     False,
                     f"Key not found: {key_path}"
                 )
             
+            algorithm, key_size, permissions_ok, static_recommendations = (
+                _static_health(str(key_path), st.st_mtime_ns, st.st_mode)
+            )
+            
             recommendations = []
             
             # Check key age
-            age_days = (datetime.now() - datetime.fromtimestamp(key_path.stat().st_mtime)).days
+            age_days = (datetime.now() - datetime.fromtimestamp(st.st_mtime)).days
             if age_days > self.MAX_KEY_AGE_DAYS:
                 recommendations.append(f"Key is {age_days} days old. Consider rotation.")
-            
-            # Check algorithm and size
-            key_info = self._get_key_info(key_path)
-            if key_info['algorithm'] in self.WEAK_ALGORITHMS:
-                recommendations.append(f"Using weak algorithm: {key_info['algorithm']}")
-            if key_info['algorithm'] == 'rsa' and key_info['size'] < 3072:
-                recommendations.append("RSA key size should be at least 3072 bits")
-            
-            # Check permissions
-            permissions = oct(key_path.stat().st_mode)[-3:]
-            permissions_ok = permissions == '600' if key_path.name.endswith('.pub') else permissions == '644'
-            if not permissions_ok:
-                recommendations.append(f"Incorrect permissions: {permissions}")
+            recommendations.extend(static_recommendations)
             
             # Get last used time (if available)
             last_used = self._get_last_used(key_path)
             
             health = KeyHealth(
                 age_days=age_days,
-                algorithm=key_info['algorithm'],
-                key_size=key_info['size'],
+                algorithm=algorithm,
+                key_size=key_size,
                 last_used=last_used,
                 permissions_ok=permissions_ok,
                 recommendations=recommendations
@@ -130,21 +171,11 @@ class KeyManager(Service):
         """Create encrypted recovery bundle"""
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            bundle_dir = self.recovery_dir / timestamp
-            bundle_dir.mkdir(parents=True)
-            
-            # Collect keys and configs
-            self._collect_recovery_items(bundle_dir)
-            
-            # Create recovery instructions
-            self._create_recovery_instructions(bundle_dir)
-            
-            # Encrypt the bundle
             bundle_file = self.recovery_dir / f"recovery_{timestamp}.tar.gz.gpg"
-            self._encrypt_bundle(bundle_dir, bundle_file, password)
             
-            # Cleanup
-            shutil.rmtree(bundle_dir)
+            # Keys, configs and instructions are streamed into the encrypted
+            # archive; nothing is staged on disk in plain form
+            self._encrypt_bundle(self._iter_recovery_items(), bundle_file, password)
             
             return self.create_result(
                 True,
@@ -159,19 +190,82 @@ class KeyManager(Service):
                 error=e
             )
 
+    def _iter_recovery_items(self) -> Iterator[Tuple[tarfile.TarInfo, BinaryIO]]:
+        """Yield archive entries for keys, configs and recovery instructions"""
+        ssh_dir = Path.home() / '.ssh'
+        sources = [(path, f"ssh/{path.name}") for path in sorted(ssh_dir.glob('id_*'))]
+        sources.append((ssh_dir / 'config', 'ssh/config'))
+        sources.append((self.config_dir / 'config.yml', 'guardian/config.yml'))
+        
+        for path, arcname in sources:
+            try:
+                f = open(path, 'rb')
+            except FileNotFoundError:
+                continue
+            with f:
+                st = os.fstat(f.fileno())
+                info = tarfile.TarInfo(arcname)
+                info.size = st.st_size
+                info.mode = st.st_mode & 0o777
+                info.mtime = int(st.st_mtime)
+                yield info, f
+        
+        instructions = RECOVERY_INSTRUCTIONS.encode()
+        info = tarfile.TarInfo('RECOVERY.txt')
+        info.size = len(instructions)
+        info.mode = 0o644
+        info.mtime = int(time.time())
+        yield info, io.BytesIO(instructions)
+
+    def _encrypt_bundle(self, items: Iterable[Tuple[tarfile.TarInfo, BinaryIO]],
+                        bundle_file: Path, password: str):
+        """Write archive entries into a gpg-encrypted .tar.gz
+
+        The gzipped tar stream is written straight to gpg's stdin, so the
+        archive never touches the disk unencrypted.
+        """
+        # stdin carries the archive, so the passphrase gets its own pipe
+        pass_read, pass_write = os.pipe()
+        try:
+            gpg = subprocess.Popen(
+                [
+                    'gpg', '--batch', '--yes',
+                    '--pinentry-mode', 'loopback',
+                    '--passphrase-fd', str(pass_read),
+                    '--symmetric', '--cipher-algo', 'AES256',
+                    '--compress-algo', 'none',  # already gzipped
+                    '-o', str(bundle_file)
+                ],
+                stdin=subprocess.PIPE,
+                pass_fds=(pass_read,)
+            )
+        except Exception:
+            os.close(pass_write)
+            raise
+        finally:
+            os.close(pass_read)
+
+        try:
+            with os.fdopen(pass_write, 'w') as f:
+                f.write(password + '\n')
+            with gpg.stdin, \
+                    gzip.GzipFile(fileobj=gpg.stdin, mode='wb', compresslevel=6) as gz, \
+                    tarfile.open(fileobj=gz, mode='w|') as tar:
+                for info, data in items:
+                    tar.addfile(info, data)
+        except Exception:
+            gpg.kill()
+            gpg.wait()
+            bundle_file.unlink(missing_ok=True)
+            raise
+
+        if gpg.wait() != 0:
+            bundle_file.unlink(missing_ok=True)
+            raise RuntimeError("Failed to encrypt recovery bundle")
+
     def _get_key_info(self, key_path: Path) -> Dict:
         """Get key algorithm and size"""
-        result = subprocess.run(
-            ['ssh-keygen', '-l', '-f', str(key_path)],
-            capture_output=True,
-            text=True
-        )
-        # Parse output like: "3072 SHA256:... user@host (RSA)"
-        parts = result.stdout.split()
-        return {
-            'size': int(parts[0]),
-            'algorithm': parts[-1].strip('()').lower()
-        }
+        return read_key_info(key_path)
 
     def _get_last_used(self, key_path: Path) -> Optional[datetime]:
         """Get last usage time of key"""
@@ -183,7 +277,8 @@ class KeyManager(Service):
         """Backup current SSH keys"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_path = self.backup_dir / timestamp
-        backup_path.mkdir(parents=True)
+        # Private keys land here before their mode is copied over
+        backup_path.mkdir(mode=0o700, parents=True)
         
         try:
             ssh_dir = Path.home() / '.ssh'
@@ -193,9 +288,12 @@ class KeyManager(Service):
                     "No SSH directory found"
                 )
             
-            # Copy all key files
-            for file in ssh_dir.glob('id_*'):
-                shutil.copy2(file, backup_path)
+            # Copy all key files; copies are I/O bound, so overlap them
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(
+                    lambda file: self._copy_key_file(file, backup_path / file.name),
+                    ssh_dir.glob('id_*')
+                ))
             
             return self.create_result(
                 True,
@@ -210,6 +308,36 @@ class KeyManager(Service):
                 error=e
             )
 
+    @staticmethod
+    def _copy_key_file(src: Path, dest: Path):
+        """Copy a key file's contents, mode and times
+        
+        The copy is created with the source's mode, so a private key is never
+        briefly world-readable, and the data is moved by copy_file_range
+        where available (a reflink on btrfs/XFS) instead of through Python.
+        """
+        with open(src, 'rb') as fsrc:
+            st = os.fstat(fsrc.fileno())
+            mode = st.st_mode & 0o777
+            fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+            with open(fd, 'wb') as fdst:
+                os.fchmod(fd, mode)  # umask may have stripped bits
+                try:
+                    remaining = st.st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fd, remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                except (AttributeError, OSError):
+                    # No copy_file_range here (macOS, old kernels, some filesystems)
+                    fsrc.seek(0)
+                    fdst.seek(0)
+                    fdst.truncate()
+                    shutil.copyfileobj(fsrc, fdst)
+                    fdst.flush()  # A write at close would reset the mtime
+                os.utime(fd, ns=(st.st_atime_ns, st.st_mtime_ns))
+
     def _verify_new_keys(self, key_path: Path) -> Result:
         """Verify newly generated keys"""
         try:
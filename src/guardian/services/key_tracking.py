@@ -1,13 +1,242 @@
 # src/guardian/services/key_tracking.py
 import sqlite3
-import subprocess
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-import sqlite3
+from datetime import datetime
+import atexit
+import queue
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 import json
-from typing import List, Dict, Optional, Tuple
+from collections import Counter
+from typing import List, Dict, Optional, Set, Tuple
 from guardian.core import Service, Result
+from guardian.services.alerts import AlertNotifier
+from guardian.services.ssh import read_key_info
+
+# Trackers to close at exit. Weak, so the single atexit hook doesn't keep
+# every instance alive.
+_open_trackers: "weakref.WeakSet[KeyTracker]" = weakref.WeakSet()
+
+@atexit.register
+def _close_all():
+    for tracker in list(_open_trackers):
+        tracker.close()
+
+# Statements run after setup; kept as constants so each string is
+# prepared once and then served from the connection's statement cache
+_SQL_INSERT_USAGE = """
+    INSERT INTO key_usage
+    (key_id, timestamp, host, platform, success, details)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_REGISTER_KEY = """
+    INSERT INTO keys
+    (key_id, path, created_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT (key_id) DO UPDATE SET path = excluded.path
+"""
+
+_SQL_HOUR_COUNTS = """
+    SELECT CAST(strftime('%H', timestamp, 'unixepoch', 'localtime')
+                AS INTEGER) as hour,
+           COUNT(*)
+    FROM key_usage
+    WHERE key_id = ?
+    AND timestamp > ?
+    GROUP BY hour
+"""
+
+# The day, host and daily queries also read rolled-up rows from
+# key_usage_daily_summary for windows reaching past the retention period
+_SQL_DAY_COUNTS = """
+    SELECT day, SUM(uses) FROM (
+        SELECT CAST(strftime('%w', timestamp, 'unixepoch', 'localtime')
+                    AS INTEGER) as day,
+               COUNT(*) as uses
+        FROM key_usage
+        WHERE key_id = ?
+        AND timestamp > ?
+        GROUP BY day
+        UNION ALL
+        SELECT CAST(strftime('%w', day) AS INTEGER), SUM(count)
+        FROM key_usage_daily_summary
+        WHERE key_id = ?
+        AND day > date(?, 'unixepoch', 'localtime')
+        GROUP BY 1
+    )
+    GROUP BY day
+"""
+
+_SQL_HOST_COUNTS = """
+    SELECT host, SUM(uses) FROM (
+        SELECT host, COUNT(*) as uses
+        FROM key_usage
+        WHERE key_id = ?
+        AND timestamp > ?
+        GROUP BY host
+        UNION ALL
+        SELECT host, SUM(count)
+        FROM key_usage_daily_summary
+        WHERE key_id = ?
+        AND day > date(?, 'unixepoch', 'localtime')
+        GROUP BY host
+    )
+    GROUP BY host
+"""
+
+_SQL_DAILY_COUNTS = """
+    SELECT day, SUM(uses) as count FROM (
+        SELECT date(timestamp, 'unixepoch', 'localtime') as day,
+               COUNT(*) as uses
+        FROM key_usage
+        WHERE key_id = ?
+        AND timestamp > ?
+        GROUP BY day
+        UNION ALL
+        SELECT day, SUM(count)
+        FROM key_usage_daily_summary
+        WHERE key_id = ?
+        AND day > date(?, 'unixepoch', 'localtime')
+        GROUP BY day
+    )
+    GROUP BY day
+    ORDER BY day DESC
+"""
+
+_SQL_SUMMARIZE_USAGE = """
+    INSERT INTO key_usage_daily_summary
+    (key_id, day, host, count, success_count)
+    SELECT key_id, date(timestamp, 'unixepoch', 'localtime'), host,
+           COUNT(*), SUM(success)
+    FROM key_usage
+    WHERE timestamp < ?
+    GROUP BY 1, 2, 3
+    ON CONFLICT (key_id, day, host) DO UPDATE
+    SET count = count + excluded.count,
+        success_count = success_count + excluded.success_count
+"""
+
+_SQL_DELETE_OLD_USAGE = """
+    DELETE FROM key_usage WHERE timestamp < ?
+"""
+
+_SQL_KEY_INFO = """
+    SELECT * FROM keys WHERE key_id = ?
+"""
+
+# Totals span the daily summary too; it keeps no platform, so
+# unique_platforms only reflects the retention period
+_SQL_USAGE_STATS = """
+    SELECT
+        COALESCE(SUM(uses), 0) as total_uses,
+        COUNT(DISTINCT host) as unique_hosts,
+        COUNT(DISTINCT platform) as unique_platforms,
+        SUM(successes) as successes,
+        MAX(last_used) as last_used
+    FROM (
+        SELECT host, platform, 1 as uses,
+               CASE WHEN success THEN 1 ELSE 0 END as successes,
+               timestamp as last_used
+        FROM key_usage
+        WHERE key_id = ?
+        UNION ALL
+        SELECT host, NULL, count, success_count,
+               CAST(strftime('%s', day, 'utc') AS INTEGER)
+        FROM key_usage_daily_summary
+        WHERE key_id = ?
+    )
+"""
+
+_SQL_RECENT_USES = """
+    SELECT *
+    FROM key_usage
+    WHERE key_id = ?
+    ORDER BY timestamp DESC
+    LIMIT 10
+"""
+
+_SQL_KNOWN_HOSTS = """
+    SELECT *
+    FROM known_hosts
+    WHERE key_id = ?
+    ORDER BY last_seen DESC
+"""
+
+_SQL_INSERT_ALERT = """
+    INSERT INTO alerts
+    (key_id, level, message, timestamp, details, recommendations)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_RECENT_COUNT = """
+    SELECT COUNT(*) as count
+    FROM key_usage
+    WHERE key_id = ?
+    AND timestamp > ?
+"""
+
+_SQL_TOUCH_KNOWN_HOST = """
+    INSERT INTO known_hosts (key_id, host, first_seen, last_seen)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT (key_id, host) DO UPDATE
+    SET last_seen = excluded.last_seen,
+        access_count = access_count + 1
+"""
+
+_SQL_LOAD_KNOWN_HOSTS = """
+    SELECT host FROM known_hosts WHERE key_id = ?
+    UNION
+    SELECT host FROM key_usage
+    WHERE key_id = ?
+    AND timestamp < ?
+    UNION
+    SELECT host FROM key_usage_daily_summary WHERE key_id = ?
+"""
+
+_SQL_ALERTS = """
+    SELECT *
+    FROM alerts
+    WHERE key_id = ?
+    ORDER BY timestamp DESC LIMIT ?
+"""
+
+_SQL_ALERTS_BY_LEVEL = """
+    SELECT *
+    FROM alerts
+    WHERE key_id = ? AND level = ?
+    ORDER BY timestamp DESC LIMIT ?
+"""
+
+# Columns converted from local-time text to epoch seconds by schema version 1
+_EPOCH_COLUMNS = (
+    ('keys', 'created_at'),
+    ('keys', 'last_used'),
+    ('key_usage', 'timestamp'),
+    ('alerts', 'timestamp'),
+    ('known_hosts', 'first_seen'),
+    ('known_hosts', 'last_seen'),
+)
+
+def _iso(value):
+    """Format an epoch column for display"""
+    return datetime.fromtimestamp(value).isoformat() if value is not None else None
+
+def _with_iso(row: sqlite3.Row, *columns: str) -> Dict:
+    """Convert a row to a dict with the given epoch columns formatted"""
+    data = dict(row)
+    for column in columns:
+        data[column] = _iso(data[column])
+    return data
+
+@lru_cache(maxsize=256)
+def _fingerprint_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """Fingerprint a key; mtime and size only serve as the cache key"""
+    return read_key_info(Path(path_str))['fingerprint']
 
 @dataclass
 class KeyUsage:
@@ -29,21 +258,157 @@ class UsagePattern:
     unusual_patterns: List[Dict]
 
 class KeyTracker(Service):
+    FLUSH_SIZE = 128        # Queued usage rows that force a flush
+    FLUSH_INTERVAL = 0.5    # Seconds between background flushes
+    RETENTION_DAYS = 30     # Raw usage kept before rolling up per day
+    ROTATE_INTERVAL = 3600  # Seconds between rotations on the flush thread
+    NOTIFY_DRAIN_TIMEOUT = 5  # Seconds close() waits for queued notifications
+    
     def __init__(self):
         super().__init__()
         self.db_path = self.config_dir / 'keytracking.db'
+        self._lock = threading.Lock()
+        self._conn = self._connect()
         self._init_db()
+        # Usage rows waiting to be written; only touched under _pending_lock
+        self._pending: List[Tuple] = []
+        self._pending_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._notify_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._notifier: Optional[threading.Thread] = None
+        # key_id -> hosts seen, mirrored from the known_hosts table
+        self._known_hosts: Dict[str, Set[str]] = {}
+        _open_trackers.add(self)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the tracking database with WAL and tuned pragmas"""
+        # Autocommit mode; transactions are opened explicitly by _transaction
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=128
+        )
+        conn.row_factory = sqlite3.Row
+        # Only takes effect on a new database; lets rotation hand pages back
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        # WAL lets readers run alongside the writer and only syncs on checkpoint
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-20000")
+        return conn
+    
+    @contextmanager
+    def _transaction(self, write: bool = True):
+        """Run statements as one transaction on the shared connection
+        
+        Write transactions take the write lock up front: a deferred one that
+        reads first cannot be retried by the busy timeout when it upgrades.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+    
+    def _optimize(self):
+        """Refresh planner statistics that SQLite judges stale or missing"""
+        try:
+            with self._lock:
+                self._conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to optimize key tracking database: {e}")
+    
+    def _rotate_usage(self):
+        """Roll usage past the retention period into the daily summary
+        
+        Keeps key_usage, and the index every hot query walks, limited to
+        the recent window.
+        """
+        cutoff = int(time.time()) - self.RETENTION_DAYS * 86400
+        try:
+            with self._transaction() as conn:
+                conn.execute(_SQL_SUMMARIZE_USAGE, (cutoff,))
+                deleted = conn.execute(_SQL_DELETE_OLD_USAGE, (cutoff,)).rowcount
+            if deleted:
+                with self._lock:
+                    self._conn.execute("PRAGMA incremental_vacuum")
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to rotate key usage: {e}")
+    
+    def _start_flusher(self):
+        """Start the background flush thread on first use"""
+        if self._flusher is None:
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                name='KeyTrackerFlush',
+                daemon=True
+            )
+            self._flusher.start()
+    
+    def _flush_loop(self):
+        # Rotation rides on the writer thread so that read-only use of the
+        # tracker never rolls up or deletes rows
+        next_rotation = 0.0
+        while not self._stopped.wait(self.FLUSH_INTERVAL):
+            self.flush()
+            if time.monotonic() >= next_rotation:
+                self._rotate_usage()
+                self._optimize()
+                next_rotation = time.monotonic() + self.ROTATE_INTERVAL
+    
+    def flush(self):
+        """Write queued usage rows in a single transaction"""
+        if not self._pending:
+            return  # Don't take the database write lock for nothing
+        try:
+            with self._transaction() as conn:
+                # Swap under the connection lock so alert checks always see
+                # a row either in the queue or in the table
+                with self._pending_lock:
+                    rows, self._pending = self._pending, []
+                if not rows:
+                    return
+                conn.executemany(_SQL_INSERT_USAGE, rows)
+        except Exception as e:
+            self.logger.error(f"Failed to write key usage: {e}")
+    
+    def close(self):
+        """Stop the background threads, write anything still queued, deliver
+        pending notifications and close the database"""
+        if self._conn is None:
+            return
+        self._stopped.set()
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            flusher.join()
+        self.flush()
+        notifier, self._notifier = self._notifier, None
+        if notifier is not None:
+            self._notify_queue.put(None)  # Sentinel: stop once drained
+            notifier.join(self.NOTIFY_DRAIN_TIMEOUT)
+        self._optimize()
+        with self._lock:
+            self._conn.close()
+            self._conn = None
+        _open_trackers.discard(self)
     
     def _init_db(self):
         """Initialize SQLite database with all necessary tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             # Basic key and usage tracking
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS keys (
                     key_id TEXT PRIMARY KEY,
                     path TEXT NOT NULL,
-                    created_at DATETIME NOT NULL,
-                    last_used DATETIME,
+                    created_at INTEGER NOT NULL,
+                    last_used INTEGER,
                     total_uses INTEGER DEFAULT 0,
                     algorithm TEXT,
                     key_size INTEGER
@@ -54,7 +419,7 @@ class KeyTracker(Service):
                 CREATE TABLE IF NOT EXISTS key_usage (
                     id INTEGER PRIMARY KEY,
                     key_id TEXT NOT NULL,
-                    timestamp DATETIME NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     host TEXT NOT NULL,
                     platform TEXT,
                     success BOOLEAN NOT NULL,
@@ -70,7 +435,7 @@ class KeyTracker(Service):
                     key_id TEXT NOT NULL,
                     level TEXT NOT NULL,
                     message TEXT NOT NULL,
-                    timestamp DATETIME NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     details TEXT,
                     recommendations TEXT,
                     acknowledged BOOLEAN DEFAULT FALSE,
@@ -83,27 +448,72 @@ class KeyTracker(Service):
                 CREATE TABLE IF NOT EXISTS known_hosts (
                     key_id TEXT NOT NULL,
                     host TEXT NOT NULL,
-                    first_seen DATETIME NOT NULL,
-                    last_seen DATETIME NOT NULL,
+                    first_seen INTEGER NOT NULL,
+                    last_seen INTEGER NOT NULL,
                     access_count INTEGER DEFAULT 1,
                     PRIMARY KEY (key_id, host),
                     FOREIGN KEY (key_id) REFERENCES keys(key_id)
                 )
             """)
 
+            # Per-day rollup of usage older than the retention period
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS key_usage_daily_summary (
+                    key_id TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    host TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    success_count INTEGER NOT NULL,
+                    PRIMARY KEY (key_id, day, host),
+                    FOREIGN KEY (key_id) REFERENCES keys(key_id)
+                )
+            """)
+
+            # Version 1 stores every timestamp as unix epoch seconds; older
+            # databases hold local-time text
+            if conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+                for table, column in _EPOCH_COLUMNS:
+                    conn.execute(f"""
+                        UPDATE {table}
+                        SET {column} = CAST(strftime('%s', {column}, 'utc') AS INTEGER)
+                        WHERE typeof({column}) = 'text'
+                    """)
+                conn.execute("PRAGMA user_version = 1")
+
+            # Every query filters by key and then by time or host
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_usage_key_ts
+                ON key_usage(key_id, timestamp DESC)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_usage_host
+                ON key_usage(key_id, host)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_alerts_key_ts
+                ON alerts(key_id, timestamp DESC)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_known_hosts_key
+                ON known_hosts(key_id, last_seen DESC)
+            """)
+
+            # Keep per-key counters current as part of each usage insert
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_usage_increment
+                AFTER INSERT ON key_usage
+                BEGIN
+                    UPDATE keys
+                    SET total_uses = total_uses + 1, last_used = NEW.timestamp
+                    WHERE key_id = NEW.key_id;
+                END
+            """)
+
     def _generate_key_id(self, key_path: Path) -> str:
         """Generate unique ID for a key"""
-        import hashlib
-        
-        # Use public key fingerprint as ID
-        result = subprocess.run(
-            ['ssh-keygen', '-l', '-f', str(key_path)],
-            capture_output=True,
-            text=True
-        )
-        
-        fingerprint = result.stdout.split()[1]
-        return fingerprint
+        # Use public key fingerprint as ID, cached until the key file changes
+        st = Path(key_path).stat()
+        return _fingerprint_cached(str(key_path), st.st_mtime_ns, st.st_size)
 
     def register_key(self, path: Path) -> Result:
         """Register a key for tracking"""
@@ -111,12 +521,8 @@ class KeyTracker(Service):
             # Generate unique key ID from public key
             key_id = self._generate_key_id(path)
             
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO keys
-                    (key_id, path, created_at)
-                    VALUES (?, ?, ?)
-                """, (key_id, str(path), datetime.now()))
+            with self._transaction() as conn:
+                conn.execute(_SQL_REGISTER_KEY, (key_id, str(path), int(time.time())))
                 
             return self.create_result(
                 True,
@@ -135,55 +541,46 @@ class KeyTracker(Service):
         """Analyze key usage patterns"""
         try:
             key_id = self._generate_key_id(key_path)
+            self.flush()
             
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                
-                # Get usage data for specified period
-                usage_data = conn.execute("""
-                    SELECT 
-                        strftime('%H', timestamp) as hour,
-                        strftime('%w', timestamp) as day_of_week,
-                        host,
-                        success
-                    FROM key_usage
-                    WHERE key_id = ?
-                    AND timestamp > datetime('now', ?)
-                """, (key_id, f'-{days} days')).fetchall()
+            with self._transaction(write=False) as conn:
+                # Aggregate usage for the period in SQLite; plain tuples
+                # are enough here, so skip the Row factory
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                window = (key_id, int(time.time()) - days * 86400)
+                
+                host_counts = dict(
+                    cursor.execute(_SQL_HOST_COUNTS, window * 2).fetchall()
+                )
                 
-                if not usage_data:
+                if not host_counts:
                     return self.create_result(
                         False,
                         "No usage data found for analysis"
                     )
                 
-                # Analyze timing patterns
-                hour_counts = {}
-                day_counts = {}
-                host_counts = {}
+                day_counts = dict(
+                    cursor.execute(_SQL_DAY_COUNTS, window * 2).fetchall()
+                )
+                
+                # Hours are only known for raw rows, not the daily summary.
+                # Counter so hours with no uses read as zero
+                hour_counts = Counter(dict(
+                    cursor.execute(_SQL_HOUR_COUNTS, window).fetchall()
+                ))
                 
-                for usage in usage_data:
-                    # Count by hour
-                    hour = int(usage['hour'])
-                    hour_counts[hour] = hour_counts.get(hour, 0) + 1
-                    
-                    # Count by day
-                    day = int(usage['day_of_week'])
-                    day_counts[day] = day_counts.get(day, 0) + 1
-                    
-                    # Count by host
-                    host = usage['host']
-                    host_counts[host] = host_counts.get(host, 0) + 1
+                total_uses = sum(host_counts.values())
                 
                 # Find common patterns
                 common_hours = [
                     hour for hour, count in hour_counts.items()
-                    if count > len(usage_data) * 0.1  # More than 10% of uses
+                    if count > total_uses * 0.1  # More than 10% of uses
                 ]
                 
                 common_hosts = [
                     host for host, count in host_counts.items()
-                    if count > len(usage_data) * 0.1
+                    if count > total_uses * 0.1
                 ]
                 
                 # Calculate average daily usage
@@ -191,16 +588,13 @@ class KeyTracker(Service):
                                (datetime.now() - datetime.fromtimestamp(
                                    key_path.stat().st_mtime
                                )).days)
-                avg_daily = len(usage_data) / total_days if total_days > 0 else 0
+                avg_daily = total_uses / total_days if total_days > 0 else 0
                 
                 # Detect unusual patterns
                 unusual = []
                 
                 # Check for odd hours
-                odd_hours = [
-                    hour for hour, count in hour_counts.items()
-                    if 0 <= hour <= 5 and count > 0
-                ]
+                odd_hours = [hour for hour in range(6) if hour_counts[hour]]
                 if odd_hours:
                     unusual.append({
                         'type': 'odd_hours',
@@ -211,23 +605,15 @@ class KeyTracker(Service):
                     })
                 
                 # Check for sudden spikes
-                for day in range(days):
-                    date = datetime.now() - timedelta(days=day)
-                    date_str = date.strftime('%Y-%m-%d')
-                    
-                    daily_count = conn.execute("""
-                        SELECT COUNT(*) as count
-                        FROM key_usage
-                        WHERE key_id = ?
-                        AND date(timestamp) = date(?)
-                    """, (key_id, date_str)).fetchone()['count']
-                    
-                    if daily_count > avg_daily * 3:  # 3x normal usage
+                daily_counts = conn.execute(_SQL_DAILY_COUNTS, window * 2)
+                
+                for row in daily_counts:
+                    if row['count'] > avg_daily * 3:  # 3x normal usage
                         unusual.append({
                             'type': 'usage_spike',
                             'details': {
-                                'date': date_str,
-                                'count': daily_count,
+                                'date': row['day'],
+                                'count': row['count'],
                                 'average': avg_daily
                             }
                         })
@@ -257,14 +643,11 @@ class KeyTracker(Service):
         """Get comprehensive key usage statistics"""
         try:
             key_id = self._generate_key_id(key_path)
+            self.flush()
             
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                
+            with self._transaction(write=False) as conn:
                 # Get basic key info
-                key_info = conn.execute("""
-                    SELECT * FROM keys WHERE key_id = ?
-                """, (key_id,)).fetchone()
+                key_info = conn.execute(_SQL_KEY_INFO, (key_id,)).fetchone()
                 
                 if not key_info:
                     return self.create_result(
@@ -273,42 +656,27 @@ class KeyTracker(Service):
                     )
                 
                 # Get usage statistics
-                stats = conn.execute("""
-                    SELECT 
-                        COUNT(*) as total_uses,
-                        COUNT(DISTINCT host) as unique_hosts,
-                        COUNT(DISTINCT platform) as unique_platforms,
-                        SUM(CASE WHEN success THEN 1 ELSE 0 END) as successes,
-                        MAX(timestamp) as last_used
-                    FROM key_usage
-                    WHERE key_id = ?
-                """, (key_id,)).fetchone()
+                stats = conn.execute(_SQL_USAGE_STATS, (key_id, key_id)).fetchone()
                 
                 # Get recent usage
-                recent_uses = conn.execute("""
-                    SELECT *
-                    FROM key_usage
-                    WHERE key_id = ?
-                    ORDER BY timestamp DESC
-                    LIMIT 10
-                """, (key_id,)).fetchall()
+                recent_uses = conn.execute(_SQL_RECENT_USES, (key_id,)).fetchall()
                 
                 # Get known hosts
-                known_hosts = conn.execute("""
-                    SELECT *
-                    FROM known_hosts
-                    WHERE key_id = ?
-                    ORDER BY last_seen DESC
-                """, (key_id,)).fetchall()
+                known_hosts = conn.execute(_SQL_KNOWN_HOSTS, (key_id,)).fetchall()
                 
                 return self.create_result(
                     True,
                     "Usage statistics retrieved",
                     {
-                        'key_info': dict(key_info),
-                        'stats': dict(stats),
-                        'recent_uses': [dict(u) for u in recent_uses],
-                        'known_hosts': [dict(h) for h in known_hosts]
+                        'key_info': _with_iso(key_info, 'created_at', 'last_used'),
+                        'stats': _with_iso(stats, 'last_used'),
+                        'recent_uses': [
+                            _with_iso(u, 'timestamp') for u in recent_uses
+                        ],
+                        'known_hosts': [
+                            _with_iso(h, 'first_seen', 'last_seen')
+                            for h in known_hosts
+                        ]
                     }
                 )
                 
@@ -329,50 +697,41 @@ class KeyTracker(Service):
         try:
             key_id = self._generate_key_id(key_path)
             
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                
-                # Record usage
-                conn.execute("""
-                    INSERT INTO key_usage
-                    (key_id, timestamp, host, platform, success, details)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
+            now = int(time.time())
+            with self._pending_lock:
+                self._pending.append((
                     key_id,
-                    datetime.now(),
+                    now,
                     host,
                     platform,
                     success,
                     json.dumps(details) if details else None
                 ))
-                
-                # Update key stats
-                conn.execute("""
-                    UPDATE keys
-                    SET last_used = ?, total_uses = total_uses + 1
-                    WHERE key_id = ?
-                """, (datetime.now(), key_id))
-                
+                queued = len(self._pending)
+            if queued >= self.FLUSH_SIZE:
+                self.flush()
+            else:
+                self._start_flusher()
+            
+            with self._transaction() as conn:
                 # Check for suspicious patterns
                 alerts = self._check_for_alerts(conn, key_id, host)
                 
                 # Store any alerts
                 for alert in alerts:
-                    conn.execute("""
-                        INSERT INTO alerts
-                        (key_id, level, message, timestamp, details, recommendations)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
+                    conn.execute(_SQL_INSERT_ALERT, (
                         key_id,
                         alert['level'],
                         alert['message'],
-                        datetime.now(),
+                        now,
                         json.dumps(alert['details']),
                         json.dumps(alert['recommendations'])
                     ))
-                
-                if alerts:
-                    self._notify_alerts(alerts)
+            
+            # Notifications can block on DBus; hand them to a worker thread
+            if alerts:
+                self._notify_queue.put(alerts)
+                self._start_notifier()
             
             return self.create_result(True, "Usage recorded successfully")
         except Exception as e:
@@ -403,12 +762,13 @@ class KeyTracker(Service):
             })
         
         # Check for rapid usage
-        recent_uses = conn.execute("""
-            SELECT COUNT(*) as count
-            FROM key_usage
-            WHERE key_id = ?
-            AND timestamp > datetime('now', '-5 minutes')
-        """, (key_id,)).fetchone()['count']
+        cutoff = int(time.time()) - 300
+        recent_uses = conn.execute(_SQL_RECENT_COUNT, (key_id, cutoff)).fetchone()['count']
+        with self._pending_lock:
+            recent_uses += sum(
+                1 for row in self._pending
+                if row[0] == key_id and row[1] > cutoff
+            )
         
         if recent_uses > 5:
             alerts.append({
@@ -425,12 +785,7 @@ class KeyTracker(Service):
             })
         
         # Check for new hosts
-        known_hosts = set(row['host'] for row in conn.execute("""
-            SELECT DISTINCT host
-            FROM key_usage
-            WHERE key_id = ?
-            AND timestamp < datetime('now', '-1 hour')
-        """, (key_id,)))
+        known_hosts = self._get_known_hosts(conn, key_id)
         
         if current_host not in known_hosts:
             alerts.append({
@@ -445,13 +800,51 @@ class KeyTracker(Service):
                     'Add to known hosts if authorized'
                 ]
             })
+            known_hosts.add(current_host)
+        
+        now = int(time.time())
+        conn.execute(_SQL_TOUCH_KNOWN_HOST, (key_id, current_host, now, now))
         
         return alerts
+    
+    def _get_known_hosts(self, conn, key_id: str) -> Set[str]:
+        """Return the in-memory set of hosts seen for a key, loading it once"""
+        hosts = self._known_hosts.get(key_id)
+        if hosts is None:
+            # Older usage rows, raw or rolled up, cover databases from
+            # before known_hosts was filled in
+            hosts = {row['host'] for row in conn.execute(
+                _SQL_LOAD_KNOWN_HOSTS,
+                (key_id, key_id, int(time.time()) - 3600, key_id)
+            )}
+            self._known_hosts[key_id] = hosts
+        return hosts
 
-    def _notify_alerts(self, alerts: List[Dict]):
+    def _start_notifier(self):
+        """Start the notification thread on first alert"""
+        if self._notifier is None:
+            self._notifier = threading.Thread(
+                target=self._notify_loop,
+                name='KeyTrackerNotify',
+                daemon=True
+            )
+            self._notifier.start()
+    
+    def _notify_loop(self):
+        # Resolve notify2 once for the life of the thread
+        notify2 = AlertNotifier._system_notifier()
+        while True:
+            alerts = self._notify_queue.get()
+            if alerts is None:
+                return
+            self._notify_alerts(alerts, notify2)
+    
+    def _notify_alerts(self, alerts: List[Dict], notify2=None):
         """Send notifications for alerts"""
         try:
             # Terminal notification
+            from rich.console import Console
+            from rich.panel import Panel
             console = Console()
             for alert in alerts:
                 console.print(Panel(
@@ -470,17 +863,13 @@ class KeyTracker(Service):
                 ))
             
             # System notification if available
-            try:
-                import notify2
-                notify2.init('Guardian')
+            if notify2:
                 for alert in alerts:
                     notification = notify2.Notification(
                         "Guardian Security Alert",
                         f"{alert['level'].upper()}: {alert['message']}"
                     )
                     notification.show()
-            except ImportError:
-                pass
                 
         except Exception as e:
             self.logger.error(f"Failed to send notifications: {e}")
@@ -491,30 +880,22 @@ class KeyTracker(Service):
         """Get recent alerts for a key"""
         try:
             key_id = self._generate_key_id(key_path)
+            self.flush()
             
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                
-                query = """
-                    SELECT *
-                    FROM alerts
-                    WHERE key_id = ?
-                """
-                params = [key_id]
-                
+            with self._transaction(write=False) as conn:
                 if level:
-                    query += " AND level = ?"
-                    params.append(level)
-                
-                query += " ORDER BY timestamp DESC LIMIT ?"
-                params.append(limit)
+                    query = _SQL_ALERTS_BY_LEVEL
+                    params = (key_id, level, limit)
+                else:
+                    query = _SQL_ALERTS
+                    params = (key_id, limit)
                 
                 alerts = []
                 for row in conn.execute(query, params):
                     alerts.append({
                         'level': row['level'],
                         'message': row['message'],
-                        'timestamp': row['timestamp'],
+                        'timestamp': _iso(row['timestamp']),
                         'details': json.loads(row['details']),
                         'recommendations': json.loads(row['recommendations']),
                         'acknowledged': bool(row['acknowledged'])
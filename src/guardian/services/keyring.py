@@ -1,46 +1,162 @@
 # src/guardian/services/keyring.py
 import keyring
+import json
 import logging
-from typing import Optional
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+from keyring.backend import KeyringBackend
 from guardian.core import Service, Result
 
+try:
+    import keyutils  # Optional: Linux kernel keyring
+except ImportError:
+    keyutils = None
+
+class KernelKeyringCache(KeyringBackend):
+    """Serve keyring reads from the Linux kernel keyring
+    
+    Kernel keys are a syscall away rather than a D-Bus round trip, but they
+    do not survive logout, so they only cache the wrapped backend: writes
+    and deletes go to it first, and cached keys expire after `timeout`.
+    Until then the plaintext secret is readable by any process running as
+    the same user, so the cache is opt-in.
+    """
+    
+    viable = False  # Wraps another backend; never picked automatically
+    priority = 0
+    TIMEOUT = 300   # Seconds a secret stays in the kernel keyring
+    
+    def __init__(self, backend: KeyringBackend, timeout: int = TIMEOUT):
+        super().__init__()
+        self.backend = backend
+        self.timeout = timeout
+    
+    @staticmethod
+    def _description(service: str, username: str) -> bytes:
+        return f"guardian:{service}:{username}".encode()
+    
+    def _find(self, description: bytes) -> Optional[int]:
+        try:
+            return keyutils.search(keyutils.KEY_SPEC_USER_KEYRING, description)
+        except keyutils.Error:
+            return None
+    
+    def _remember(self, description: bytes, password: str):
+        try:
+            key_id = keyutils.add_key(description, password.encode(),
+                                      keyutils.KEY_SPEC_USER_KEYRING)
+            keyutils.set_timeout(key_id, self.timeout)
+        except keyutils.Error:
+            pass
+    
+    def _forget(self, description: bytes):
+        key_id = self._find(description)
+        if key_id is not None:
+            try:
+                keyutils.unlink(key_id, keyutils.KEY_SPEC_USER_KEYRING)
+            except keyutils.Error:
+                pass
+    
+    def get_password(self, service: str, username: str) -> Optional[str]:
+        description = self._description(service, username)
+        key_id = self._find(description)
+        if key_id is not None:
+            try:
+                return keyutils.read_key(key_id).decode('utf-8')
+            except keyutils.Error:
+                pass  # Expired or revoked between search and read
+        password = self.backend.get_password(service, username)
+        if password is not None:
+            self._remember(description, password)
+        return password
+    
+    def set_password(self, service: str, username: str, password: str):
+        self.backend.set_password(service, username, password)
+        self._remember(self._description(service, username), password)
+    
+    def delete_password(self, service: str, username: str):
+        self._forget(self._description(service, username))
+        self.backend.delete_password(service, username)
+
+def kernel_cache_available() -> bool:
+    """Whether the kernel keyring can be used: Linux with keyutils installed"""
+    return keyutils is not None and sys.platform == 'linux' and os.path.exists('/proc/keys')
+
 class KeyringManager(Service):
     """Secure credential storage using system keyring"""
     
-    def __init__(self, service_name: str = "guardian"):
+    CACHE_TTL = 30.0  # Seconds a keyring read is served from memory
+    INDEX_KEY = "__guardian_index__"  # JSON list of the stored credential keys
+    KNOWN_PREFIXES = ['github_token_', 'gpg_key_', 'ssh_key_']
+    
+    def __init__(self, service_name: str = "guardian",
+                 cache_ttl: float = CACHE_TTL,
+                 kernel_cache: bool = False,
+                 backend: Optional[KeyringBackend] = None):
         """
         Initialize KeyringManager
         
         Args:
             service_name: Name to use for keyring service
+            cache_ttl: Seconds to reuse a value read from the keyring
+            kernel_cache: Cache this manager's secrets in the Linux kernel
+                keyring between runs; they are readable there by any process
+                of the same user until they expire
+            backend: Keyring backend to use instead of the process-wide one
         """
         super().__init__()
+        if kernel_cache and kernel_cache_available():
+            backend = KernelKeyringCache(backend or keyring.get_keyring())
+        self.backend = backend
         self.service_name = service_name
+        self._ttl = cache_ttl
+        # key -> (value or None, time read); each keyring call is an IPC hop
+        self._cache: Dict[str, Tuple[Optional[str], float]] = {}
+        # (credential keys, time listed) for list_credentials()
+        self._keys: Optional[Tuple[List[str], float]] = None
+        # key -> added (True) or removed (False), while inside batch()
+        self._index_changes: Optional[Dict[str, bool]] = None
         self.logger = logging.getLogger(__name__)
-        logging.basicConfig(level=logging.DEBUG)
 
-    def store_credential(self, key: str, value: str) -> Result:
-        """Store a credential in the system keyring"""
+    def _backend(self) -> KeyringBackend:
+        """The backend given at construction, else the current keyring"""
+        return self.backend if self.backend is not None else keyring.get_keyring()
+
+    def store_credential(self, key: str, value: str,
+                         verify: bool = False) -> Result:
+        """Store a credential in the system keyring
+        
+        Backends raise when a write fails, so by default the value is not
+        read back; pass verify=True to compare it against the keyring.
+        """
         try:
-            self.logger.debug(f"Attempting to store credential with key: {key}")
-            keyring.set_password(self.service_name, key, value)
+            self.logger.debug("Attempting to store credential with key: %s", key)
+            self._backend().set_password(self.service_name, key, value)
 
-            # Verify storage
-            stored = self.get_credential(key)
-            if stored == value:
-                self.logger.debug("Credential stored and verified successfully")
-                return self.create_result(
-                    True,
-                    f"Credential '{key}' stored successfully"
-                )
-            else:  # Fixed indentation and spelling
-                self.logger.error("Credential verification failed - stored value doesn't match")
-                return self.create_result(
-                    False,
-                    "Credential verification failed"
-                )
+            if verify:
+                # Verify storage against the backend, not the cache
+                stored = self._backend().get_password(self.service_name, key)
+                if stored != value:
+                    self._cache.pop(key, None)
+                    self.logger.error("Credential verification failed - stored value doesn't match")
+                    return self.create_result(
+                        False,
+                        "Credential verification failed"
+                    )
+            
+            self._cache[key] = (value, time.monotonic())
+            self._update_index(add=[key])
+            self.logger.debug("Credential stored successfully")
+            return self.create_result(
+                True,
+                f"Credential '{key}' stored successfully"
+            )
         except Exception as e:
-            self.logger.error(f"Failed to store credential: {str(e)}")  # Fixed typo in 'store'
+            self.logger.error("Failed to store credential: %s", e)  # Fixed typo in 'store'
             return self.create_result(
                 False,
                 f"Failed to store credential '{key}'",
@@ -49,32 +165,247 @@ class KeyringManager(Service):
 
     def get_credential(self, key: str) -> Optional[str]:
         """Retrieve a credential from the system keyring"""
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[1] < self._ttl:
+            return entry[0]
+        
         try:
-            self.logger.debug(f"Attempting to retrieve credential with key: {key}")
-            value = keyring.get_password(self.service_name, key)  # Store result in value
-            self.logger.debug(f"Credential retrieval result: {'Found' if value else 'Not found'}")
+            self.logger.debug("Attempting to retrieve credential with key: %s", key)
+            value = self._backend().get_password(self.service_name, key)  # Store result in value
+            self._cache[key] = (value, time.monotonic())
+            self.logger.debug("Credential retrieval result: %s", 'Found' if value else 'Not found')
             return value  # Return the value
         except Exception as e:
-            self.logger.error(f"Failed to retrieve credential '{key}': {e}")
+            self.logger.error("Failed to retrieve credential '%s': %s", key, e)
+            return None
+
+    def get_credentials(self, keys: List[str]) -> Dict[str, Optional[str]]:
+        """Retrieve several credentials, reading the keyring once where possible"""
+        now = time.monotonic()
+        values: Dict[str, Optional[str]] = {}
+        missing = []
+        for key in keys:
+            entry = self._cache.get(key)
+            if entry is not None and now - entry[1] < self._ttl:
+                values[key] = entry[0]
+            else:
+                missing.append(key)
+        
+        if missing:
+            try:
+                fetched = self._fetch_many(missing)
+            except Exception as e:
+                self.logger.error("Failed to retrieve credentials: %s", e)
+                fetched = dict.fromkeys(missing)
+            else:
+                now = time.monotonic()
+                for key, value in fetched.items():
+                    self._cache[key] = (value, now)
+            values.update(fetched)
+        
+        return {key: values[key] for key in keys}
+
+    def _fetch_many(self, keys: List[str]) -> Dict[str, Optional[str]]:
+        """Read keys from the backend in as few round trips as it allows"""
+        backend = self._backend()
+        
+        # Secret Service can return every item for the service in one call
+        try:
+            items = self._search_collection(backend)
+            if items is not None:
+                found = {}
+                for item in items:
+                    username = item.get_attributes().get('username')
+                    found[username] = item.get_secret().decode('utf-8')
+                return {key: found.get(key) for key in keys}
+        except Exception as e:
+            self.logger.debug("Collection search failed, reading keys one by one: %s", e)
+        
+        if len(keys) == 1:
+            return {keys[0]: backend.get_password(self.service_name, keys[0])}
+        
+        # Otherwise overlap the per-key round trips
+        with ThreadPoolExecutor(max_workers=min(8, len(keys))) as executor:
+            values = executor.map(
+                lambda key: backend.get_password(self.service_name, key), keys
+            )
+            return dict(zip(keys, values))
+
+    def _search_collection(self, backend=None) -> Optional[list]:
+        """Return every Secret Service item for this service in one D-Bus call
+        
+        None when the backend has no collection API (macOS, Windows, ...).
+        """
+        backend = backend or self._backend()
+        if isinstance(backend, KernelKeyringCache):
+            backend = backend.backend
+        get_collection = getattr(backend, 'get_preferred_collection', None)
+        if get_collection is None:
+            return None
+        return list(get_collection().search_items({'service': self.service_name}))
+
+    def store_credentials(self, credentials: Dict[str, str]) -> Result:
+        """Store several credentials, updating the index once"""
+        backend = self._backend()
+        stored = []
+        try:
+            for key, value in credentials.items():
+                backend.set_password(self.service_name, key, value)
+                self._cache[key] = (value, time.monotonic())
+                stored.append(key)
+            return self.create_result(
+                True,
+                f"Stored {len(stored)} credentials",
+                {'keys': stored}
+            )
+        except Exception as e:
+            self.logger.error("Failed to store credentials: %s", e)
+            return self.create_result(
+                False,
+                f"Failed to store credentials after {len(stored)} of {len(credentials)}",
+                {'keys': stored},
+                error=e
+            )
+        finally:
+            if stored:
+                self._update_index(add=stored)
+
+    def delete_credentials(self, keys: List[str]) -> Result:
+        """Delete several credentials, updating the index once"""
+        backend = self._backend()
+        deleted = []
+        try:
+            existing = [key for key, value in self.get_credentials(keys).items() if value]
+            for key in existing:
+                backend.delete_password(self.service_name, key)
+                self._cache.pop(key, None)
+                deleted.append(key)
+            return self.create_result(
+                True,
+                f"Deleted {len(deleted)} credentials",
+                {'keys': deleted}
+            )
+        except Exception as e:
+            self.logger.error("Failed to delete credentials: %s", e)
+            return self.create_result(
+                False,
+                f"Failed to delete credentials after {len(deleted)}",
+                {'keys': deleted},
+                error=e
+            )
+        finally:
+            if deleted:
+                self._update_index(remove=deleted)
+
+    @contextmanager
+    def batch(self):
+        """Defer credential index updates to a single write on exit
+        
+        Each store or delete otherwise rewrites the index entry; inside
+        the block the changes are collected and applied once. Credential
+        values themselves are still written immediately.
+        """
+        if self._index_changes is not None:
+            yield self  # Nested: the outer block flushes
+            return
+        self._index_changes = {}
+        try:
+            yield self
+        finally:
+            changes, self._index_changes = self._index_changes, None
+            if changes:
+                self._update_index(
+                    add=[key for key, added in changes.items() if added],
+                    remove=[key for key, added in changes.items() if not added]
+                )
+
+    def invalidate(self, key: Optional[str] = None):
+        """Drop cached values so the next read goes to the keyring"""
+        if key is None:
+            self._cache.clear()
+            self._keys = None
+        else:
+            self._cache.pop(key, None)
+
+    def _read_index(self) -> Optional[List[str]]:
+        """Return the stored credential keys, or None if there is no index yet"""
+        raw = self.get_credential(self.INDEX_KEY)
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            self.logger.warning("Credential index is corrupt; ignoring it")
+            return None
+
+    def _probe_credentials(self) -> List[str]:
+        """Find credentials by probing the known default keys"""
+        values = self.get_credentials(
+            [f"{prefix}default" for prefix in self.KNOWN_PREFIXES]
+        )
+        return [key for key, value in values.items() if value]
+
+    def _list_from_collection(self) -> Optional[List[str]]:
+        """List stored keys from their Secret Service attributes, if available"""
+        try:
+            items = self._search_collection()
+        except Exception as e:
+            self.logger.debug("Collection search failed: %s", e)
+            return None
+        if items is None:
             return None
+        keys = (item.get_attributes().get('username') for item in items)
+        return [key for key in keys if key and key != self.INDEX_KEY]
+
+    def _update_index(self, add: Iterable[str] = (),
+                      remove: Iterable[str] = ()):
+        """Add or remove keys in the credential index"""
+        if self._index_changes is not None:
+            self._index_changes.update(dict.fromkeys(remove, False))
+            self._index_changes.update(dict.fromkeys(add, True))
+            self._keys = None
+            return
+        keys = self._read_index()
+        if keys is None:
+            # First write: seed from whatever the old probe would find
+            keys = self._probe_credentials()
+        removed = set(remove)
+        updated = [k for k in keys if k not in removed]
+        updated.extend(k for k in dict.fromkeys(add) if k not in updated)
+        if updated == keys:
+            return
+        keys = updated
+        raw = json.dumps(keys)
+        self._backend().set_password(self.service_name, self.INDEX_KEY, raw)
+        now = time.monotonic()
+        self._cache[self.INDEX_KEY] = (raw, now)
+        self._keys = (keys, now)
 
     def list_credentials(self) -> Result:
         """List all stored credential keys"""
         try:
             self.logger.debug("Listing credentials")
-            keys = []
-            known_prefixes = ['github_token_', 'gpg_key_', 'ssh_key_']
-            for prefix in known_prefixes:  # Fixed variable name from 'key' to 'prefix'
-                if self.get_credential(f"{prefix}default"):
-                    keys.append(f"{prefix}default")
+            # Writes through this manager keep the listing current; other
+            # processes' changes show up once it ages past the TTL
+            cached = self._keys
+            if cached is not None and time.monotonic() - cached[1] < self._ttl:
+                keys = cached[0]
+            else:
+                # One keyring read for the index instead of a probe per prefix
+                keys = self._read_index()
+                if keys is None:
+                    keys = self._list_from_collection()
+                if keys is None:
+                    keys = self._probe_credentials()
+                self._keys = (keys, time.monotonic())
             
             return self.create_result(  # Added missing return statement
                 True,
                 f"Found {len(keys)} credentials",
-                {'keys': keys}
+                {'keys': list(keys)}
             )
         except Exception as e:
-            self.logger.error(f"Failed to list credentials: {e}")
+            self.logger.error("Failed to list credentials: %s", e)
             return self.create_result(
                 False,
                 "Failed to list credentials",
@@ -94,7 +425,9 @@ class KeyringManager(Service):
         """
         try:
             if self.get_credential(key):
-                keyring.delete_password(self.service_name, key)
+                self._backend().delete_password(self.service_name, key)
+                self._cache.pop(key, None)
+                self._update_index(remove=[key])
                 return self.create_result(
                     True,
                     f"Credential '{key}' deleted successfully"
@@ -109,6 +442,19 @@ class KeyringManager(Service):
                 f"Failed to delete credential '{key}'",
                 error=e
             )
+
+    def _read_write(self, key: str, new_value: str) -> Optional[str]:
+        """Replace a credential's value and return the previous one
+        
+        The previous value comes from the cache when fresh; a missing key is
+        left untouched and None returned.
+        """
+        old_value = self.get_credential(key)
+        if old_value is not None:
+            self._backend().set_password(self.service_name, key, new_value)
+            self._cache[key] = (new_value, time.monotonic())
+        return old_value
+
     def rotate_credential(self, key: str, new_value: str) -> Result:
         """
         Safely rotate a credential value
@@ -121,30 +467,23 @@ class KeyringManager(Service):
             Result indicating success or failure
         """
         try:
-            # Keep old value in case we need to rollback
-            old_value = self.get_credential(key)
+            # One read and one write; the key is already
+            # in the index, so unlike store_credential there is no index update
+            old_value = self._read_write(key, new_value)
             if old_value is None:
                 return self.create_result(
                     False,
                     f"Credential '{key}' not found"
                 )
             
-            # Try to store new value
-            store_result = self.store_credential(key, new_value)
-            if not store_result.success:
-                return store_result
-            
             return self.create_result(
                 True,
                 f"Credential '{key}' rotated successfully"
             )
         except Exception as e:
-            # Try to rollback if we have the old value
-            if old_value:
-                try:
-                    self.store_credential(key, old_value)
-                except Exception:
-                    pass
+            # The write is the last step, so a failure leaves the old value in
+            # place; just make sure the next read goes back to the keyring
+            self._cache.pop(key, None)
             
             return self.create_result(
                 False,
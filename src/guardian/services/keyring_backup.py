@@ -18,9 +18,6 @@ class KeyringManager(Service):
         self.service_name = service_name
         self.logger = logging.getLogger(__name__)
 
-        # Set up debug logging
-        logging.basicConfig(level=logging.DEBUG)
-
     def store_credential(self, key: str, value: str) -> Result:
         """
         Store a credential in the system keyring
@@ -33,25 +30,25 @@ class KeyringManager(Service):
             Result indicating success or failure
         """
         try:
-            self.logger.debug(f"Attempting to store credential with key: {key}")
+            self.logger.debug("Attempting to store credential with key: %s", key)
             keyring.set_password(self.service_name, key, value)
 
             # Verify storage
             stored = self.get_credential(key)
             if stored == value:
                 self.logger.debug("Credential stored and verified successfully")
-            return self.create_result(
-                True,
-                f"Credential '{key}' stored successfully"
-            )
+                return self.create_result(
+                    True,
+                    f"Credential '{key}' stored successfully"
+                )
             else:
                 self.logger.error("Credential verification falied - stored value doesn't match")
                 return self.create_result(
-                   False,
-                   "Credential verification failed"
+                    False,
+                    "Credential verification failed"
                 )
         except Exception as e:
-            self.logger.error(f"Failed to stare credential: {str(e)}")
+            self.logger.error("Failed to stare credential: %s", e)
             return self.create_result(
                 False,
                 f"Failed to store credential '{key}'",
@@ -69,13 +66,13 @@ class KeyringManager(Service):
             The stored credential value or None if not found
         """
         try:
-            self.logger.debug(f"Attempting to retrieve credential with key {key}")
+            self.logger.debug("Attempting to retrieve credential with key %s", key)
             return keyring.get_password(self.service_name, key)
-            self.logger.debug(f"Credential retrieval result: {'Found' if value else 'Not found'}")
+            self.logger.debug("Credential retrieval result: %s", 'Found' if value else 'Not found')
             return value
         except Exception as e:
 
-            self.logger.error(f"Failed to retrieve credential '{key}': {e}")
+            self.logger.error("Failed to retrieve credential '%s': %s", key, e)
             return None
 
     def delete_credential(self, key: str) -> Result:
@@ -123,14 +120,17 @@ class KeyringManager(Service):
             # In that case, we'd need to maintain our own index
             keys = []
             known_prefixes = ['github_token_', 'gpg_key_', 'ssh_key_']
-            for key in known_prefixes:
+            for prefix in known_prefixes:
                 if self.get_credential(f"{prefix}default"):
                     keys.append(f"{prefix}default")
             
-            self.logger.error(f"Failed to list credentials: {e}")
             return self.create_result(
+                True,
+                f"Found {len(keys)} credentials",
+                {'keys': keys}
+            )
         except Exception as e:
-            self.logger.error(f"Failed to list credentials: {e}")
+            self.logger.error("Failed to list credentials: %s", e)
             return self.create_result(
                 False,
                 "Failed to list credentials",
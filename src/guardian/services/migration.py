@@ -1,12 +1,28 @@
 # src/guardian/services/migration.py
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import tempfile
 import subprocess
 from pathlib import Path
 import shutil
+from guardian.core import DATACLASS_SLOTS
+from guardian.services.platform.base import GitPlatform, IssueData
 
-@dataclass
+@lru_cache(maxsize=128)
+def _parse_repo_string(repo: str) -> Tuple[str, str]:
+    """Split 'owner/repo' or a clone URL into (owner, repo)"""
+    path = repo.rstrip('/')
+    if path.endswith('.git'):
+        path = path[:-4]
+    rest, _, name = path.replace(':', '/').rpartition('/')
+    owner = rest.rpartition('/')[2]
+    if not owner or not name:
+        raise ValueError(f"Cannot parse repository: {repo}")
+    return owner, name
+
+@dataclass(**DATACLASS_SLOTS)
 class MigrationPlan:
     """Plan for repository migration"""
     source_platform: str
@@ -16,7 +32,7 @@ class MigrationPlan:
     items: Dict[str, bool]  # What to migrate (code, issues, PRs, etc.)
     estimated_time: int     # Estimated minutes
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MigrationResult:
     """Results of migration attempt"""
     success: bool
@@ -27,6 +43,9 @@ class MigrationResult:
 class PlatformMigration:
     """Handles repository migration between platforms"""
     
+    MAX_CONCURRENT_ISSUES = 10  # Parallel create_issue calls on the target
+    OPEN_STATES = frozenset({'open', 'opened', 'new'})  # Open on any platform
+    
     def __init__(self, source_platform: GitPlatform, target_platform: GitPlatform):
         self.source = source_platform
         self.target = target_platform
@@ -95,16 +114,52 @@ class PlatformMigration:
         
         return results
 
+    def _parse_repo_string(self, repo: str) -> Tuple[str, str]:
+        """Split a repository reference into (owner, repo)"""
+        return _parse_repo_string(repo)
+
+    def _clone_repository(self, source_repo: str, temp_dir: str):
+        """Mirror-clone the source repository into temp_dir
+        
+        A bare mirror has every branch and tag but no working tree, so
+        nothing is checked out just to be pushed again.
+        """
+        result = subprocess.run(
+            ['git', 'clone', '--mirror', '--quiet', source_repo, temp_dir],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to clone {source_repo}: {result.stderr.strip()}")
+
+    def _migrate_code(self, temp_dir: str, target_repo: str, results: MigrationResult):
+        """Push all branches and tags from the mirror clone to the target"""
+        result = subprocess.run(
+            ['git', 'push', '--mirror', '--quiet', target_repo],
+            cwd=temp_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to push to {target_repo}: {result.stderr.strip()}")
+        results.items_migrated['code'] = 1
+
     def _migrate_issues(self, plan: MigrationPlan, results: MigrationResult):
-        """Migrate issues between platforms"""
+        """Migrate issues between platforms
+        
+        Issues are created concurrently, so they may not land on the target
+        in source order; rate limiting is left to the platform sessions.
+        """
         try:
             # Get source issues
             source_issues = self.source.get_issues(
                 *self._parse_repo_string(plan.source_repo)
             )
+            target_owner, target_repo = self._parse_repo_string(plan.target_repo)
             
-            migrated = 0
-            for issue in source_issues:
+            def migrate_one(issue: IssueData) -> Optional[str]:
                 try:
                     # Convert to target platform format
                     converted_issue = self._convert_issue_format(
@@ -115,21 +170,36 @@ class PlatformMigration:
                     
                     # Create on target platform
                     self.target.create_issue(
-                        *self._parse_repo_string(plan.target_repo),
+                        target_owner,
+                        target_repo,
                         converted_issue
                     )
-                    migrated += 1
+                    return None
                     
                 except Exception as e:
-                    results.warnings.append(
-                        f"Failed to migrate issue {issue.id}: {str(e)}"
-                    )
+                    return f"Failed to migrate issue {issue.id}: {str(e)}"
+            
+            migrated = 0
+            with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_ISSUES) as pool:
+                for warning in pool.map(migrate_one, source_issues):
+                    if warning is None:
+                        migrated += 1
+                    else:
+                        results.warnings.append(warning)
             
             results.items_migrated['issues'] = migrated
             
         except Exception as e:
             results.errors.append(f"Issue migration failed: {str(e)}")
 
+    def _convert_state(self, state: str, source_platform: str,
+                       target_platform: str) -> str:
+        """Map an issue state onto the target platform's names"""
+        is_open = state.lower() in self.OPEN_STATES
+        if target_platform.startswith('GitLab'):
+            return 'opened' if is_open else 'closed'
+        return 'open' if is_open else 'closed'
+
     def _convert_issue_format(self, issue: IssueData,
                             source_platform: str,
                             target_platform: str) -> Dict[str, Any]:
@@ -3,8 +3,9 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from guardian.core import DATACLASS_SLOTS
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class IssueData:
     """Common issue format across platforms"""
     id: str
@@ -18,7 +19,7 @@ class IssueData:
     comments: int
     platform_specific: Dict[str, Any]
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PRData:
     """Common pull request format across platforms"""
     id: str
@@ -1,7 +1,38 @@
 # src/guardian/services/platforms/github.py
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlparse
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from guardian.services.api import parse_json
+from guardian.services.migration import MigrationPlan, PlatformMigration
+from guardian.services.platform.base import GitPlatform, IssueData, PRData
+
+try:
+    import ciso8601  # Optional: much faster timestamp parsing
+except ImportError:
+    ciso8601 = None
+
+if ciso8601 is not None:
+    # Bound once so parsing each timestamp is a single C call
+    _parse_timestamp = ciso8601.parse_datetime_as_naive
+else:
+    def _parse_timestamp(value: str) -> datetime:
+        """Parse a GitHub ISO 8601 timestamp into a naive UTC datetime"""
+        return datetime.fromisoformat(value[:-1] if value[-1:] == 'Z' else value)
+
 class GitHubPlatform(GitPlatform):
     """GitHub-specific implementation"""
     
+    API_URL = 'https://api.github.com'
+    PER_PAGE = 100               # GitHub's maximum page size
+    MAX_CONCURRENT_PAGES = 8     # Matches the session's pool size
+    REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+    MAX_RATE_LIMIT_WAIT = 60     # Longest sleep for a rate-limit reset
+    
     def _create_session(self):
         session = requests.Session()
         session.headers.update({
@@ -9,32 +40,134 @@ class GitHubPlatform(GitPlatform):
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': 'Guardian-Git-Tool'
         })
+        # Keep-alive pool shared by every call, including concurrent page fetches
+        session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.MAX_CONCURRENT_PAGES,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504)
+            )
+        ))
         return session
     
-    def get_issues(self, owner: str, repo: str) -> List[IssueData]:
-        response = self.session.get(
-            f"https://api.github.com/repos/{owner}/{repo}/issues"
-        )
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, waiting once for the rate limit to reset if hit"""
+        kwargs.setdefault('timeout', self.REQUEST_TIMEOUT)
+        response = self.session.request(method, url, **kwargs)
+        if (response.status_code in (403, 429) and
+                response.headers.get('X-RateLimit-Remaining') == '0'):
+            reset = int(response.headers.get('X-RateLimit-Reset', 0))
+            wait = reset - time.time()
+            if 0 < wait <= self.MAX_RATE_LIMIT_WAIT:
+                time.sleep(wait)
+                response = self.session.request(method, url, **kwargs)
         response.raise_for_status()
+        return response
+    
+    def get_issues(self, owner: str, repo: str) -> List[IssueData]:
+        parse = self._parse_issue
+        return [
+            parse(item)
+            for page in self._get_pages(f"{self.API_URL}/repos/{owner}/{repo}/issues")
+            for item in page
+        ]
+    
+    def get_pull_requests(self, owner: str, repo: str) -> List[PRData]:
+        parse = self._parse_pull_request
+        return [
+            parse(item)
+            for page in self._get_pages(f"{self.API_URL}/repos/{owner}/{repo}/pulls")
+            for item in page
+        ]
+    
+    def _get_pages(self, url: str) -> List[List[Dict[str, Any]]]:
+        """Fetch every page of a list endpoint, in order
         
-        issues = []
-        for item in response.json():
-            issues.append(IssueData(
-                id=str(item['number']),
-                title=item['title'],
-                description=item['body'] or '',
-                state=item['state'],
-                created_at=datetime.fromisoformat(item['created_at'].rstrip('Z')),
-                updated_at=datetime.fromisoformat(item['updated_at'].rstrip('Z')),
-                labels=[l['name'] for l in item['labels']],
-                assignees=[a['login'] for a in item['assignees']],
-                comments=item['comments'],
-                platform_specific={
-                    'node_id': item['node_id'],
-                    'url': item['html_url']
-                }
-            ))
-        return issues
+        The first page tells us how many pages there are; the rest are
+        fetched concurrently over the session's pooled connections.
+        """
+        first = self._get_page(url, 1)
+        pages = [parse_json(first)]
+        last_page = self._last_page(first)
+        if last_page > 1:
+            workers = min(last_page - 1, self.MAX_CONCURRENT_PAGES)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                pages.extend(pool.map(lambda p: parse_json(self._get_page(url, p)),
+                                      range(2, last_page + 1)))
+        return pages
+    
+    def _get_page(self, url: str, page: int) -> requests.Response:
+        """Fetch one page of a list endpoint"""
+        return self._request(
+            'GET', url,
+            params={'per_page': self.PER_PAGE, 'page': page}
+        )
+    
+    @staticmethod
+    def _last_page(response: requests.Response) -> int:
+        """Read the last page number from the Link header, if any"""
+        last = response.links.get('last')
+        if not last:
+            return 1
+        pages = parse_qs(urlparse(last['url']).query).get('page')
+        return int(pages[0]) if pages else 1
+    
+    @staticmethod
+    def _parse_issue(item: Dict[str, Any]) -> IssueData:
+        """Convert a GitHub issue payload into IssueData"""
+        # Most issues have no labels or assignees; skip the comprehension then
+        labels = item['labels']
+        assignees = item['assignees']
+        return IssueData(
+            id=str(item['number']),
+            title=item['title'],
+            description=item['body'] or '',
+            state=item['state'],
+            created_at=_parse_timestamp(item['created_at']),
+            updated_at=_parse_timestamp(item['updated_at']),
+            labels=[l['name'] for l in labels] if labels else [],
+            assignees=[a['login'] for a in assignees] if assignees else [],
+            comments=item['comments'],
+            platform_specific={
+                'node_id': item['node_id'],
+                'url': item['html_url']
+            }
+        )
+
+    @staticmethod
+    def _parse_pull_request(item: Dict[str, Any]) -> PRData:
+        """Convert a GitHub pull request payload into PRData"""
+        labels = item['labels']
+        reviewers = item['requested_reviewers']
+        return PRData(
+            id=str(item['number']),
+            title=item['title'],
+            description=item['body'] or '',
+            state=item['state'],
+            source_branch=item['head']['ref'],
+            target_branch=item['base']['ref'],
+            created_at=_parse_timestamp(item['created_at']),
+            updated_at=_parse_timestamp(item['updated_at']),
+            labels=[l['name'] for l in labels] if labels else [],
+            reviewers=[r['login'] for r in reviewers] if reviewers else [],
+            comments=item.get('comments', 0),  # Not included in list responses
+            platform_specific={
+                'node_id': item['node_id'],
+                'url': item['html_url']
+            }
+        )
 
     def migrate_to(self, target_platform: GitPlatform,
-                   source_repo: str, target_repo: str)
+                   source_repo: str, target_repo: str) -> bool:
+        """Mirror the repository's code and issues to another platform"""
+        plan = MigrationPlan(
+            source_platform=type(self).__name__,
+            target_platform=type(target_platform).__name__,
+            source_repo=source_repo,
+            target_repo=target_repo,
+            items={'code': True, 'issues': True},
+            estimated_time=0
+        )
+        return PlatformMigration(self, target_platform).execute_migration(plan).success
@@ -1,31 +1,133 @@
 # src/guardian/services/ssh.py
+import base64
+import hashlib
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, FrozenSet, List, Dict, Optional, Tuple
+from cryptography.exceptions import UnsupportedAlgorithm
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import dsa, ec, ed25519, rsa
+from cryptography.hazmat.primitives.serialization import (
+    Encoding, NoEncryption, PrivateFormat, PublicFormat
+)
 from guardian.core import Service, Result
 
+def _algorithm_of(key) -> Optional[str]:
+    """Name a public key the way ssh-keygen -l does (lowercased)"""
+    if isinstance(key, rsa.RSAPublicKey):
+        return 'rsa'
+    if isinstance(key, ed25519.Ed25519PublicKey):
+        return 'ed25519'
+    if isinstance(key, ec.EllipticCurvePublicKey):
+        return 'ecdsa'
+    if isinstance(key, dsa.DSAPublicKey):
+        return 'dsa'
+    return None
+
+def read_key_info(key_path: Path) -> Dict[str, Any]:
+    """Get algorithm, size and SHA256 fingerprint of an SSH key
+    
+    Parses the public key in-process; falls back to ssh-keygen when there
+    is no readable .pub file or the key type is not understood.
+    """
+    key_path = Path(key_path)
+    pub_path = key_path if key_path.suffix == '.pub' else Path(f"{key_path}.pub")
+    try:
+        data = pub_path.read_bytes()
+        key = serialization.load_ssh_public_key(data)
+        algorithm = _algorithm_of(key)
+        if algorithm is not None:
+            blob = base64.b64decode(data.split()[1])
+            digest = base64.b64encode(hashlib.sha256(blob).digest()).rstrip(b'=')
+            return {
+                'size': 256 if algorithm == 'ed25519' else key.key_size,
+                'algorithm': algorithm,
+                'fingerprint': f"SHA256:{digest.decode()}"
+            }
+    except (OSError, ValueError, IndexError, UnsupportedAlgorithm):
+        pass
+
+    result = subprocess.run(
+        ['ssh-keygen', '-l', '-f', str(key_path)],
+        capture_output=True,
+        text=True
+    )
+    # Parse output like: "3072 SHA256:... user@host (RSA)"
+    parts = result.stdout.split()
+    return {
+        'size': int(parts[0]),
+        'algorithm': parts[-1].strip('()').lower(),
+        'fingerprint': parts[1]
+    }
+
+def _write_key_file(path: Path, data: bytes, mode: int, overwrite: bool = False):
+    """Write a key file that is created with its final mode
+    
+    O_EXCL means the file never exists with looser permissions, and an
+    existing file raises FileExistsError unless overwrite removes it first.
+    """
+    if overwrite:
+        path.unlink(missing_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        os.fchmod(fd, mode)  # umask may have stripped bits we want
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
 class SSHManager(Service):
     """SSH key management service"""
+    
+    KEY_TYPES = {
+        'rsa': 'id_rsa',
+        'ed25519': 'id_ed25519',
+        'ecdsa': 'id_ecdsa'
+    }
+    
     def __init__(self):
         super().__init__()
         self.ssh_dir = Path.home() / '.ssh'
         self.ssh_dir.mkdir(mode=0o700, exist_ok=True)
+        # mkdir ignores the mode when the directory already exists
+        os.chmod(self.ssh_dir, 0o700)
+        self._scan: Optional[Tuple[int, FrozenSet[str]]] = None  # (dir mtime, names)
+
+    def _key_files(self) -> FrozenSet[str]:
+        """Names of the id_* files in the SSH directory
+        
+        One directory read replaces a stat per candidate file; the listing
+        is reused until the directory's mtime changes.
+        """
+        try:
+            mtime = os.stat(self.ssh_dir).st_mtime_ns
+        except FileNotFoundError:
+            return frozenset()
+        if self._scan is None or self._scan[0] != mtime:
+            with os.scandir(self.ssh_dir) as entries:
+                names = frozenset(e.name for e in entries if e.name.startswith('id_'))
+            self._scan = (mtime, names)
+        return self._scan[1]
 
     def list_ssh_keys(self) -> Result:
         """List all SSH keys with their content"""
         try:
-            key_types = {
-                'rsa': ('id_rsa', 'id_rsa.pub'),
-                'ed25519': ('id_ed25519', 'id_ed25519.pub'),
-                'ecdsa': ('id_ecdsa', 'id_ecdsa.pub')
-            }
+            present = self._key_files()
+            found = [
+                (key_type, self.ssh_dir / f"{private}.pub")
+                for key_type, private in self.KEY_TYPES.items()
+                if f"{private}.pub" in present
+            ]
 
+            # Overlap the reads; on NFS or remote homes each one is a round trip
             keys = []
-            for key_type, (private, public) in key_types.items():
-                pub_path = self.ssh_dir / public
-                if pub_path.exists():
+            with ThreadPoolExecutor(max_workers=max(len(found), 1)) as executor:
+                reads = [(key_type, pub_path, executor.submit(pub_path.read_bytes))
+                         for key_type, pub_path in found]
+                for key_type, pub_path, read in reads:
                     try:
-                        content = pub_path.read_text().strip()
+                        content = read.result().decode('utf-8', 'replace').strip()
                         keys.append({
                             'type': key_type,
                             'path': str(pub_path),
@@ -51,6 +153,7 @@ class SSHManager(Service):
         key_path = self.ssh_dir / 'id_ed25519'
         pub_key_path = key_path.with_suffix('.pub') # Derive public key path
         
+        # Checked on disk, not through the cached _key_files() listing
         if key_path.exists() and not force:
             return self.create_result(
                 False,
@@ -59,17 +162,23 @@ class SSHManager(Service):
             )
         
         try:
-            cmd = [
-                'ssh-keygen',
-                '-t', 'ed25519',
-                '-C', email,
-                '-f', str(key_path),
-                '-N', '' # Empty passphrase
-            ]
+            # Generated in-process rather than by forking ssh-keygen
+            private_key = ed25519.Ed25519PrivateKey.generate()
+            private_bytes = private_key.private_bytes(
+                Encoding.PEM,
+                PrivateFormat.OpenSSH,
+                NoEncryption()  # Empty passphrase
+            )
+            public_bytes = private_key.public_key().public_bytes(
+                Encoding.OpenSSH,
+                PublicFormat.OpenSSH
+            )
             
-            subprocess.run(cmd, check=True)
-            key_path.chmod(0o600)
-            pub_key_path.chmod(0o644)
+            _write_key_file(key_path, private_bytes, 0o600, overwrite=force)
+            # The public half always follows the private key just written
+            _write_key_file(pub_key_path, public_bytes + f" {email}\n".encode(), 0o644,
+                            overwrite=True)
+            self._scan = None
             
             return self.create_result(
                 True,
@@ -80,7 +189,7 @@ class SSHManager(Service):
                 }
             )
 
-        except subprocess.CalledProcessError as e:
+        except (OSError, ValueError) as e:
             return self.create_result(
                 False,
                 "Failed to generate SSH key",
@@ -1,8 +1,83 @@
 # src/guardian/services/status.py
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import List, Dict, Optional
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import json
+import os
+import shutil
 import subprocess
+import time
+
+# Last check_all() payload; its mtime is the cache timestamp
+STATUS_CACHE = Path.home() / '.cache' / 'guardian' / 'status.json'
+
+def invalidate_status_cache():
+    """Drop the cached status after a change that affects it"""
+    try:
+        os.unlink(STATUS_CACHE)
+    except FileNotFoundError:
+        pass
+
+def _run(args: List[str]) -> subprocess.CompletedProcess:
+    """Run a probe command, capturing raw output
+    
+    LC_ALL=C spares the tools their locale setup and keeps their output
+    in the untranslated form the probes parse. The rest of the
+    environment (HOME, GNUPGHOME, GH_TOKEN...) is passed through.
+    """
+    return subprocess.run(
+        args,
+        capture_output=True,
+        check=False,
+        env={**os.environ, 'LC_ALL': 'C'}
+    )
+
+@lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """shutil.which, walking $PATH once per tool"""
+    return shutil.which(name)
+
+class GitProbe:
+    """Global git configuration, read with one git call"""
+    
+    @staticmethod
+    def collect() -> Dict[str, str]:
+        # With -z each entry is "key\nvalue" and entries are NUL-terminated
+        result = _run(['git', 'config', '--global', '--list', '-z'])
+        config = {}
+        for entry in result.stdout.decode('utf-8', 'replace').split('\0'):
+            key, _, value = entry.partition('\n')
+            config[key] = value  # Later entries win, as with git config <key>
+        return config
+
+class GhProbe:
+    """GitHub CLI availability and authentication"""
+    
+    @staticmethod
+    def collect() -> Dict[str, bool]:
+        if not _which('gh'):
+            return {'installed': False, 'authenticated': False}
+        result = _run(['gh', 'auth', 'status'])
+        return {'installed': True, 'authenticated': result.returncode == 0}
+
+class GpgProbe:
+    """GPG availability and secret key IDs, read with one gpg call"""
+    
+    @staticmethod
+    def collect() -> Dict:
+        if not _which('gpg'):
+            return {'installed': False, 'ok': False, 'keys': []}
+        result = _run(['gpg', '--batch', '--no-tty', '--with-colons',
+                       '--fixed-list-mode', '--list-secret-keys'])
+        # Colon records: field 0 is the record type, field 4 the long key ID
+        keys = [
+            fields[4].decode('ascii')  # Hex key IDs; UIDs are never decoded
+            for fields in (line.split(b':') for line in result.stdout.splitlines())
+            if fields[0] == b'sec'
+        ]
+        return {'installed': True, 'ok': result.returncode == 0, 'keys': keys}
 
 @dataclass
 class ServiceStatus:
@@ -15,8 +90,84 @@ class ServiceStatus:
 class StatusChecker:
     """Check status of various services and configurations"""
     
+    CACHE_TTL = 5  # Seconds a cached check_all() payload stays fresh
+    
     def __init__(self, config_service):
         self.config = config_service
+        # Configured token names -> the names found in the keyring
+        self._tokens_found: Dict[tuple, tuple] = {}
+        # Probe class -> collected data, so each tool runs once per checker
+        self._probes: Dict[type, Dict] = {}
+
+    def refresh(self):
+        """Forget cached probe results so the next checks run them again"""
+        self._tokens_found.clear()
+        self._probes.clear()
+        _which.cache_clear()
+        invalidate_status_cache()
+
+    def _probe(self, probe) -> Dict:
+        """Collect a probe's data once and reuse it until refresh()"""
+        data = self._probes.get(probe)
+        if data is None:
+            data = self._probes[probe] = probe.collect()
+        return data
+
+    def check_all(self, keyring_manager) -> Dict[str, ServiceStatus]:
+        """Run every status check concurrently
+        
+        The checks are dominated by git/gh/gpg subprocesses and keyring
+        IPC, so running them side by side costs roughly the slowest one.
+        A payload younger than the 'status_cache_ttl' config value (default
+        CACHE_TTL seconds) is reused from disk, which keeps repeated calls
+        from shell prompts cheap. The config and auth services, and the CLI
+        commands that change git config, unlink it when they change what
+        the checks read.
+        """
+        ttl = float(self.config.get('status_cache_ttl', self.CACHE_TTL))
+        cached = self._load_cached(ttl)
+        if cached is not None:
+            return cached
+        
+        checks = {
+            'ssh': self.check_ssh,
+            'git': self.check_git,
+            'github': lambda: self.check_github(keyring_manager),
+            'gpg': self.check_gpg
+        }
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {name: executor.submit(check) for name, check in checks.items()}
+            statuses = {name: future.result() for name, future in futures.items()}
+        
+        if ttl > 0:
+            self._store_cached(statuses)
+        return statuses
+
+    @staticmethod
+    def _load_cached(ttl: float) -> Optional[Dict[str, ServiceStatus]]:
+        """The cached payload if it is younger than ttl seconds"""
+        try:
+            if time.time() - os.stat(STATUS_CACHE).st_mtime >= ttl:
+                return None
+            with open(STATUS_CACHE, 'rb') as f:
+                payload = json.load(f)
+            return {name: ServiceStatus(**status) for name, status in payload.items()}
+        except (OSError, ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _store_cached(statuses: Dict[str, ServiceStatus]):
+        """Atomically replace the cached payload"""
+        try:
+            STATUS_CACHE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp = STATUS_CACHE.with_name(f'{STATUS_CACHE.name}.{os.getpid()}.tmp')
+            # Key IDs and token names are not for other users' eyes
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, 'w') as f:
+                json.dump({name: asdict(status) for name, status in statuses.items()}, f)
+            os.replace(tmp, STATUS_CACHE)
+        except OSError:
+            pass  # A missing cache only costs the next caller a fresh check
 
     def check_ssh(self, ssh_dir: Path = Path.home() / '.ssh') -> ServiceStatus:
         """Check SSH configuration status"""
@@ -34,18 +185,20 @@ class StatusChecker:
         found_keys = []
         for key_type, (private, public) in key_types.items():
             priv_path = ssh_dir / private
-            pub_path = ssh_dir / public
             
-            if priv_path.exists() and pub_path.exists():
-                found_keys.append(key_type)
-                try:
-                    # Check permissions
-                    priv_perms = oct(priv_path.stat().st_mode)[-3:]
-                    if priv_perms != '600':
-                        warnings.append(f"{private} has incorrect permissions: {priv_perms}")
-                        recommendations.append(f"Run: chmod 600 {priv_path}")
-                except Exception:
-                    warnings.append(f"Could not check permissions for {private}")
+            # One stat gives both existence and permissions of the private key
+            try:
+                st = os.stat(priv_path)
+            except OSError:
+                continue
+            if not os.path.exists(ssh_dir / public):
+                continue
+            
+            found_keys.append(key_type)
+            priv_perms = st.st_mode & 0o777
+            if priv_perms != 0o600:
+                warnings.append(f"{private} has incorrect permissions: {priv_perms:03o}")
+                recommendations.append(f"Run: chmod 600 {priv_path}")
         
         details['existing_keys'] = ', '.join(found_keys) if found_keys else 'None'
         
@@ -68,28 +221,13 @@ class StatusChecker:
         details = {}
         
         try:
-            # Check git config
-            configs = {
-                'user.name': 'git config --global user.name',
-                'user.email': 'git config --global user.email',
-                'user.signingkey': 'git config --global user.signingkey'
-            }
+            config = self._probe(GitProbe)
             
-            for key, command in configs.items():
-                try:
-                    result = subprocess.run(
-                        command.split(),
-                        capture_output=True,
-                        text=True,
-                        check=False
-                    )
-                    value = result.stdout.strip()
-                    details[key] = value if value else 'Not set'
-                    if not value:
-                        recommendations.append(f"Set {key} using: guardian config set {key}")
-                except:
-                    details[key] = 'Error checking'
-                    warnings.append(f"Could not check {key}")
+            for key in ('user.name', 'user.email', 'user.signingkey'):
+                value = config.get(key, '').strip()
+                details[key] = value if value else 'Not set'
+                if not value:
+                    recommendations.append(f"Set {key} using: guardian config set {key}")
         
         except Exception as e:
             warnings.append(f"Error checking git config: {e}")
@@ -110,43 +248,42 @@ class StatusChecker:
         # Check configuration
         config = self.config._config.get('auth', {}).get('github_tokens', [])
         
-        # Check keyring for each configured token
-        tokens_found = []
-        for name in config:
-            key = f"github_token_{name}"
-            if keyring_manager.get_credential(key):
-                tokens_found.append(name)
-            else:
-                warnings.append(f"Token '{name}' configured but not found in keyring")
+        # Check keyring for each configured token, in one batch per config
+        names = tuple(config)
+        tokens_found = self._tokens_found.get(names)
+        if tokens_found is None:
+            values = keyring_manager.get_credentials(
+                [f"github_token_{name}" for name in names]
+            )
+            tokens_found = tuple(name for name in names if values[f"github_token_{name}"])
+            self._tokens_found[names] = tokens_found
+        warnings.extend(
+            f"Token '{name}' configured but not found in keyring"
+            for name in names if name not in tokens_found
+        )
         
         if tokens_found:
             details['token_status'] = 'Configured'
-            details['tokens'] = tokens_found
+            details['tokens'] = list(tokens_found)
         else:
             details['token_status'] = 'Not configured'
             recommendations.append("Run: guardian auth setup-github to configure GitHub access")
         
         # Check for gh CLI
-        import shutil
-        if shutil.which('gh'):
-            try:
-                result = subprocess.run(
-                    ['gh', 'auth', 'status'],
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
-                if result.returncode == 0:
-                    details['gh_cli'] = 'Authenticated'
-                else:
-                    details['gh_cli'] = 'Not authenticated'
-                    recommendations.append("Run: gh auth login to authenticate GitHub CLI")
-            except:
-                details['gh_cli'] = 'Error checking'
-                warnings.append("Could not check GitHub CLI status")
+        try:
+            gh = self._probe(GhProbe)
+        except Exception:
+            details['gh_cli'] = 'Error checking'
+            warnings.append("Could not check GitHub CLI status")
         else:
-            details['gh_cli'] = 'Not installed'
-            recommendations.append("Consider installing GitHub CLI: https://cli.github.com")
+            if not gh['installed']:
+                details['gh_cli'] = 'Not installed'
+                recommendations.append("Consider installing GitHub CLI: https://cli.github.com")
+            elif gh['authenticated']:
+                details['gh_cli'] = 'Authenticated'
+            else:
+                details['gh_cli'] = 'Not authenticated'
+                recommendations.append("Run: gh auth login to authenticate GitHub CLI")
         
         return ServiceStatus(
             configured=bool(tokens_found),
@@ -162,8 +299,8 @@ class StatusChecker:
         details = {}
         
         try:
-            # Check for gpg command
-            if not shutil.which('gpg'):
+            gpg = self._probe(GpgProbe)
+            if not gpg['installed']:
                 details['gpg_status'] = 'Not installed'
                 recommendations.append("Install GPG for secure key management")
                 return ServiceStatus(
@@ -173,24 +310,10 @@ class StatusChecker:
                     recommendations=recommendations
                 )
             
-            # Check for keys
-            result = subprocess.run(
-                ['gpg', '--list-secret-keys', '--keyid-format', 'LONG'],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            if result.returncode == 0:
-                if 'sec' in result.stdout:
+            if gpg['ok']:
+                if gpg['keys']:
                     details['gpg_status'] = 'Keys found'
-                    # Parse key details if needed
-                    keys = []
-                    for line in result.stdout.splitlines():
-                        if line.startswith('sec'):
-                            key_id = line.split('/')[1].split(' ')[0]
-                            keys.append(key_id)
-                    details['keys'] = keys
+                    details['keys'] = gpg['keys']
                 else:
                     details['gpg_status'] = 'No keys found'
                     recommendations.append("Run: guardian auth setup-gpg to create a GPG key")
@@ -1,21 +1,56 @@
 # src/guardian/hooks/manager.py
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import os
 import yaml
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from jinja2 import Template
 
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# template_dir -> (directory mtime_ns, parsed templates)
+_TEMPLATE_CACHE: Dict[Path, Tuple[int, Dict[str, Dict[str, Any]]]] = {}
+
+def _load_template(path: Path) -> Tuple[str, Any]:
+    """Read and parse one template file"""
+    return path.stem, yaml.load(path.read_bytes(), Loader=_SafeLoader)
+
 class HookManager:
     def __init__(self):
         self.template_dir = Path(__file__).parent.parent / 'templates' / 'hooks'
         self.template_dir.mkdir(parents=True, exist_ok=True)
     
     def list_templates(self) -> Dict[str, Dict[str, Any]]:
-        """List available hook templates"""
-        templates = {}
-        for file in self.template_dir.glob('*.yml'):
-            with open(file) as f:
-                templates[file.stem] = yaml.safe_load(f)
-        return templates
+        """List available hook templates
+        
+        Parsed templates are reused until the template directory's mtime
+        changes (a file added, removed or replaced); call invalidate()
+        after editing a template in place.
+        """
+        mtime = self.template_dir.stat().st_mtime_ns
+        cached = _TEMPLATE_CACHE.get(self.template_dir)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, self._load_templates())
+            _TEMPLATE_CACHE[self.template_dir] = cached
+        return dict(cached[1])
+    
+    def invalidate(self):
+        """Drop cached templates so the next listing re-reads them"""
+        _TEMPLATE_CACHE.pop(self.template_dir, None)
+    
+    def _load_templates(self) -> Dict[str, Dict[str, Any]]:
+        """Read and parse every template in the template directory"""
+        files = list(self.template_dir.glob('*.yml'))
+        if len(files) <= 1:
+            return dict(map(_load_template, files))
+        
+        # Overlap the file reads; results keep the glob order
+        workers = min(8, len(files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(executor.map(_load_template, files))
     
     def generate_hook(self, hook_type: str, template_name: str = 'default',
                      context: Optional[Dict[str, Any]] = None) -> str:
@@ -24,8 +59,7 @@ class HookManager:
         if not template_file.exists():
             raise ValueError(f"Template '{template_name}' not found")
         
-        with open(template_file) as f:
-            template_data = yaml.safe_load(f)
+        template_data = yaml.load(template_file.read_bytes(), Loader=_SafeLoader)
         
         hook_data = template_data['hooks'].get(hook_type)
         if not hook_data:
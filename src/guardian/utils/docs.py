@@ -3,83 +3,20 @@ import click
 from rich.console import Console
 from rich.markdown import Markdown
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, TextIO
 import datetime
+import io
 
-def generate_feature_list(cli: click.Group) -> str:
-    """Generate feature list from CLI commands"""
-    features = []
-    
-    def _process_command(cmd: click.Command, parent: str = ""):
-        if isinstance(cmd, click.Group):
-            # Add group description
-            if cmd.help:
-                features.append(f"### {cmd.name.title()}")
-                features.append(f"{cmd.help}\n")
-            
-            # Process subcommands
-            for sub_cmd_name, sub_cmd in cmd.commands.items():
-                _process_command(sub_cmd, f"{parent} {cmd.name}".strip())
-        else:
-            # Add command as feature
-            command_path = f"{parent} {cmd.name}".strip()
-            features.append(f"- `{command_path}`: {cmd.help}")
-
-    _process_command(cli)
-    return "\n".join(features)
-
-def generate_changelog_entry(version: str, changes: List[Dict[str, str]]) -> str:
-    """Generate a changelog entry"""
-    today = datetime.datetime.now().strftime("%Y-%m-%d")
-    
-    sections = {
-        "added": [],
-        "changed": [],
-        "fixed": [],
-    }
-    
-    for change in changes:
-        section = change.get("type", "added").lower()
-        if section in sections:
-            sections[section].append(change["description"])
-    
-    lines = [
-        f"## [{version}] - {today}\n"
-    ]
-    
-    if sections["added"]:
-        lines.append("### Added")
-        lines.extend(f"- {item}" for item in sections["added"])
-        lines.append("")
-        
-    if sections["changed"]:
-        lines.append("### Changed")
-        lines.extend(f"- {item}" for item in sections["changed"])
-        lines.append("")
-        
-    if sections["fixed"]:
-        lines.append("### Fixed")
-        lines.extend(f"- {item}" for item in sections["fixed"])
-        lines.append("")
-    
-    return "\n".join(lines)
-
-def generate_docs():
-    """Generate project documentation"""
-    from guardian.cli import cli  # Import your CLI
-    docs_dir = Path("docs")
-    docs_dir.mkdir(exist_ok=True)
-    
-    # Generate README.md
-    features = generate_feature_list(cli)
-    readme_content = f"""# deadlight-guardian
+_README_HEAD = """\
+# deadlight-guardian
 
 Git Authentication & Development Interface Assistant & Navigator
 
 ## Features
 
-{features}
+"""
 
+_README_TAIL = """
 ## Installation
 
 ```bash
@@ -146,9 +83,9 @@ We welcome contributions! Please see our [Contributing Guide](CONTRIBUTING.md) f
 
 MIT License - see [LICENSE](LICENSE) for details.
 """
-    
-    # Generate CONTRIBUTING.md
-    contributing_content = """# Contributing to deadlight-guardian
+
+_CONTRIBUTING = b"""\
+# Contributing to deadlight-guardian
 
 We love your input! We want to make contributing as easy and transparent as possible.
 
@@ -195,6 +132,15 @@ pytest
 
 # Run with coverage
 pytest --cov=guardian
+
+# Run test files in parallel (pytest-xdist)
+pytest -n auto --dist loadfile
+
+# Include tests marked slow (real git/keyring), as CI does
+pytest -m "slow or not slow"
+
+# Re-run only the tests that failed last time
+pytest --lf
 ```
 
 ## Pull Request Process
@@ -204,22 +150,8 @@ pytest --cov=guardian
 3. The PR will be merged once you have the sign-off of another developer.
 """
 
-    # Write files
-    with open("README.md", "w") as f:
-        f.write(readme_content)
-    
-    with open("CONTRIBUTING.md", "w") as f:
-        f.write(contributing_content)
-    
-    # Generate initial CHANGELOG.md
-    initial_changes = [
-        {"type": "added", "description": "Initial release with core functionality"},
-        {"type": "added", "description": "Authentication management (SSH, GitHub)"},
-        {"type": "added", "description": "Configuration management"},
-        {"type": "added", "description": "Hook management"},
-    ]
-    
-    changelog_content = """# Changelog
+_CHANGELOG_HEAD = """\
+# Changelog
 
 All notable changes to this project will be documented in this file.
 
@@ -227,7 +159,83 @@ The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),
 and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).
 
 """
-    changelog_content += generate_changelog_entry("1.0.0", initial_changes)
+
+_INITIAL_CHANGES = [
+    {"type": "added", "description": "Initial release with core functionality"},
+    {"type": "added", "description": "Authentication management (SSH, GitHub)"},
+    {"type": "added", "description": "Configuration management"},
+    {"type": "added", "description": "Hook management"},
+]
+
+def _write_features(cmd: click.Command, out: TextIO, parent: str = ""):
+    """Write a feature line per command, and a heading per group, to out"""
+    if isinstance(cmd, click.Group):
+        # Add group description
+        if cmd.help:
+            out.write(f"### {cmd.name.title()}\n{cmd.help}\n\n")
+        
+        # Process subcommands
+        path = f"{parent} {cmd.name}".strip()
+        for sub_cmd in cmd.commands.values():
+            _write_features(sub_cmd, out, path)
+    else:
+        # Add command as feature
+        command_path = f"{parent} {cmd.name}".strip()
+        out.write(f"- `{command_path}`: {cmd.help}\n")
+
+def generate_feature_list(cli: click.Group) -> str:
+    """Generate feature list from CLI commands"""
+    out = io.StringIO()
+    _write_features(cli, out)
+    return out.getvalue()[:-1]  # No trailing newline, as before
+
+def generate_changelog_entry(version: str, changes: List[Dict[str, str]]) -> str:
+    """Generate a changelog entry"""
+    today = datetime.datetime.now().strftime("%Y-%m-%d")
+    
+    sections = {
+        "added": [],
+        "changed": [],
+        "fixed": [],
+    }
     
+    for change in changes:
+        section = change.get("type", "added").lower()
+        if section in sections:
+            sections[section].append(change["description"])
+    
+    out = io.StringIO()
+    out.write(f"## [{version}] - {today}\n")
+    
+    for section, title in (("added", "Added"), ("changed", "Changed"), ("fixed", "Fixed")):
+        if sections[section]:
+            out.write(f"\n### {title}")
+            for item in sections[section]:
+                out.write(f"\n- {item}")
+            out.write("\n")
+    
+    return out.getvalue()
+
+def generate_docs():
+    """Generate project documentation
+    
+    Each file is written as it is produced; the feature list goes straight
+    from the command tree into README.md.
+    """
+    from guardian.cli import cli  # Import your CLI
+    docs_dir = Path("docs")
+    docs_dir.mkdir(exist_ok=True)
+    
+    # Generate README.md
+    with open("README.md", "w", buffering=1 << 16) as f:
+        f.write(_README_HEAD)
+        _write_features(cli, f)
+        f.write(_README_TAIL)
+    
+    # CONTRIBUTING.md is static
+    Path("CONTRIBUTING.md").write_bytes(_CONTRIBUTING)
+    
+    # Generate initial CHANGELOG.md
     with open("CHANGELOG.md", "w") as f:
-        f.write(changelog_content)
+        f.write(_CHANGELOG_HEAD)
+        f.write(generate_changelog_entry("1.0.0", _INITIAL_CHANGES))
@@ -3,12 +3,18 @@ from typing import Any, Dict, Optional
 import json
 import yaml
 import csv
+import io
 from pathlib import Path
 from datetime import datetime
 from rich.console import Console
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import XMLGenerator
 from abc import ABC, abstractmethod
 
+try:
+    import orjson  # Optional: faster JSON encoding
+except ImportError:
+    orjson = None
+
 class Exporter(ABC):
     """Base class for exporters"""
     @abstractmethod
@@ -17,9 +23,27 @@ class Exporter(ABC):
 
 class JSONExporter(Exporter):
     def export(self, data: Dict[str, Any], file_path: Optional[Path] = None) -> str:
-        content = json.dumps(data, indent=2)
+        if orjson is not None:
+            try:
+                # Datetimes and dataclasses are handed back rather than
+                # encoded natively, so they fail here as they do in json
+                encoded = orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS
+                )
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; let json handle it
+            else:
+                if file_path:
+                    file_path.write_bytes(encoded)
+                return encoded.decode()
+        
+        # Raw UTF-8 like orjson, so output doesn't depend on what's installed
+        content = json.dumps(data, indent=2, ensure_ascii=False)
         if file_path:
-            file_path.write_text(content)
+            file_path.write_text(content, encoding='utf-8')
         return content
 
 class YAMLExporter(Exporter):
@@ -39,38 +63,60 @@ class CSVExporter(Exporter):
         return content
 
     def _flatten_dict(self, d: Dict, parent_key: str = '', sep: str = '.') -> Dict:
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep).items())
+        # Depth-first over a stack of (prefix, items) iterators rather than
+        # recursing, so nested keys keep their order without rebuilding dicts
+        flattened = {}
+        stack = [(parent_key, iter(d.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for k, v in items:
+                new_key = f"{prefix}{sep}{k}" if prefix else k
+                if isinstance(v, dict):
+                    stack.append((new_key, iter(v.items())))
+                    break
+                flattened[new_key] = v
             else:
-                items.append((new_key, v))
-        return dict(items)
+                stack.pop()
+        return flattened
+
+    @staticmethod
+    def _csv_field(value: Any) -> str:
+        """Quote a field, doubling embedded quotes; None stays empty"""
+        if value is None:
+            return ''
+        return '"' + str(value).replace('"', '""') + '"'
 
     def _dict_to_csv(self, data: Dict) -> str:
-        output = []
-        headers = list(data.keys())
-        output.append(','.join(f'"{h}"' for h in headers))
-        output.append(','.join(f'"{data[h]}"' if data[h] is not None else '' for h in headers))
-        return '\n'.join(output)
+        # Same layout as always: every field quoted, rows joined by newlines
+        # with none after the last; only the quote escaping is new
+        field = self._csv_field
+        return '\n'.join(
+            ','.join(map(field, row)) for row in (data.keys(), data.values())
+        )
 
 class XMLExporter(Exporter):
     def export(self, data: Dict[str, Any], file_path: Optional[Path] = None) -> str:
-        root = ET.Element("report")
-        self._dict_to_xml(data, root)
-        content = ET.tostring(root, encoding='unicode', method='xml')
+        # Serialize while walking the data instead of building an element
+        # tree first and serializing it in a second pass
+        output = io.StringIO()
+        writer = XMLGenerator(output, encoding='utf-8', short_empty_elements=True)
+        writer.startElement("report", {})
+        self._dict_to_xml(data, writer)
+        writer.endElement("report")
+        content = output.getvalue()
         if file_path:
             file_path.write_text(content)
         return content
 
-    def _dict_to_xml(self, data: Dict[str, Any], parent: ET.Element):
+    def _dict_to_xml(self, data: Dict[str, Any], writer: XMLGenerator):
         for key, value in data.items():
-            child = ET.SubElement(parent, str(key))
+            tag = str(key)
+            writer.startElement(tag, {})
             if isinstance(value, dict):
-                self._dict_to_xml(value, child)
+                self._dict_to_xml(value, writer)
             else:
-                child.text = str(value)
+                writer.characters(str(value))
+            writer.endElement(tag)
 
 class ExportManager:
     """Manages data exports in various formats"""
@@ -2,8 +2,21 @@
 import click
 from rich.tree import Tree
 from rich.console import Console
+from fnmatch import translate
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+import os
+import re
+
+@lru_cache(maxsize=32)
+def _ignore_matcher(ignore_patterns: Tuple[str, ...]) -> Callable[[str], bool]:
+    """Compile glob patterns into one name matcher"""
+    if not ignore_patterns:
+        return lambda name: False
+    regex = re.compile('|'.join(translate(pattern) for pattern in ignore_patterns))
+    return lambda name: regex.match(name) is not None
 
 class CommandTreeGenerator:
     """Generate command trees for CLI documentation"""
@@ -11,6 +24,17 @@ class CommandTreeGenerator:
     def __init__(self, cli: click.Group):
         self.cli = cli
         self.console = Console()
+        # id(group) -> its subcommands sorted by name, shared by both outputs
+        self._sorted: Dict[int, Tuple[Tuple[str, click.Command], ...]] = {}
+    
+    def _subcommands(self, group: click.Group) -> Tuple[Tuple[str, click.Command], ...]:
+        """A group's (name, command) pairs, sorted once per generator"""
+        subcommands = self._sorted.get(id(group))
+        if subcommands is None:
+            subcommands = self._sorted[id(group)] = tuple(
+                sorted(group.commands.items(), key=itemgetter(0))
+            )
+        return subcommands
     
     def generate_markdown(self) -> str:
         """Generate markdown representation of command tree"""
@@ -28,10 +52,7 @@ class CommandTreeGenerator:
                 lines.append(f"{prefix}    - {command.help}")
             
             # Sort commands for consistent output
-            sorted_commands = sorted(command.commands.items(), 
-                                   key=lambda x: x[0])
-            
-            for _, cmd in sorted_commands:
+            for _, cmd in self._subcommands(command):
                 self._add_command_to_markdown(cmd, lines, level + 1)
         else:
             lines.append(f"{prefix}* {command.name}")
@@ -48,7 +69,7 @@ class CommandTreeGenerator:
                             tree: Tree):
         """Recursively build rich tree"""
         if isinstance(command, click.Group):
-            for name, cmd in sorted(command.commands.items()):
+            for name, cmd in self._subcommands(command):
                 branch = tree.add(
                     f"[bold cyan]{name}[/bold cyan]" + 
                     (f"\n[dim]{cmd.help}[/dim]" if cmd.help else "")
@@ -70,29 +91,10 @@ class ProjectTreeGenerator:
             ignore_patterns = ['__pycache__', '*.pyc', '.git', 'venv']
             
         lines = [f"# Project Structure: {self.root_path.name}\n"]
-        self._add_path_to_markdown(self.root_path, lines, ignore_patterns)
+        for depth, name, is_dir in self._walk(ignore_patterns):
+            lines.append(f"{'    ' * depth}* {name}{'/' if is_dir else ''}")
         return "\n".join(lines)
     
-    def _add_path_to_markdown(self, path: Path, lines: List[str], 
-                            ignore_patterns: List[str], level: int = 0):
-        """Recursively build markdown tree"""
-        prefix = "    " * level
-        
-        # Skip ignored patterns
-        if any(path.match(pattern) for pattern in ignore_patterns):
-            return
-            
-        if path.is_dir():
-            lines.append(f"{prefix}* {path.name}/")
-            
-            # Sort entries for consistent output
-            entries = sorted(path.iterdir(), key=lambda p: (p.is_file(), p.name))
-            
-            for entry in entries:
-                self._add_path_to_markdown(entry, lines, ignore_patterns, level + 1)
-        else:
-            lines.append(f"{prefix}* {path.name}")
-    
     def print_tree(self, ignore_patterns: Optional[List[str]] = None):
         """Print rich tree representation of project"""
         if ignore_patterns is None:
@@ -102,19 +104,46 @@ class ProjectTreeGenerator:
             f"[bold]{self.root_path.name}[/bold]",
             guide_style="bold bright_blue"
         )
-        self._add_path_to_tree(self.root_path, tree, ignore_patterns)
+        # parents[d] is the node that entries at depth d are added to
+        parents = [tree]
+        for depth, name, is_dir in self._walk(ignore_patterns):
+            if is_dir:
+                del parents[depth + 1:]
+                parents.append(parents[depth].add(f"[bold cyan]{name}/[/bold cyan]"))
+            else:
+                parents[depth].add(f"[green]{name}[/green]")
         self.console.print(tree)
     
-    def _add_path_to_tree(self, path: Path, tree: Tree, 
-                         ignore_patterns: List[str]):
-        """Recursively build rich tree"""
-        if any(path.match(pattern) for pattern in ignore_patterns):
+    def _walk(self, ignore_patterns: List[str]) -> Iterator[Tuple[int, str, bool]]:
+        """Yield (depth, name, is_dir) for the project tree, depth-first
+        
+        Directories are read with os.scandir, whose entries know their type
+        without a stat per file; symlinked directories are not followed.
+        """
+        ignored = _ignore_matcher(tuple(ignore_patterns))
+        root = self.root_path
+        if ignored(root.name):
             return
-            
-        if path.is_dir():
-            branch = tree.add(f"[bold cyan]{path.name}/[/bold cyan]")
-            entries = sorted(path.iterdir(), key=lambda p: (p.is_file(), p.name))
-            for entry in entries:
-                self._add_path_to_tree(entry, branch, ignore_patterns)
-        else:
-            tree.add(f"[green]{path.name}[/green]")
+        if not root.is_dir():
+            yield 0, root.name, False
+            return
+        
+        yield 0, root.name, True
+        stack = [iter(self._entries(root, ignored))]
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                continue
+            is_dir = entry.is_dir(follow_symlinks=False)
+            yield len(stack), entry.name, is_dir
+            if is_dir:
+                stack.append(iter(self._entries(entry.path, ignored)))
+    
+    @staticmethod
+    def _entries(path, ignored: Callable[[str], bool]) -> List[os.DirEntry]:
+        """Non-ignored entries of a directory, directories first, by name"""
+        with os.scandir(path) as it:
+            entries = [e for e in it if not ignored(e.name)]
+        entries.sort(key=lambda e: (not e.is_dir(follow_symlinks=False), e.name))
+        return entries
@@ -1,19 +1,112 @@
 # tests/conftest.py
 import pytest
-from pathlib import Path
-import tempfile
 import shutil
+import subprocess
+import sys
 import os
+import keyring
+from keyring.backend import KeyringBackend
+from keyring.errors import PasswordDeleteError
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 from guardian.core.auth import AuthService
 from guardian.core.config import ConfigService
 from guardian.core.repo import RepoService
 from guardian.core.security import SecurityService
 
+def pytest_configure(config):
+    """Keep test files in RAM when GUARDIAN_FAST_TMP=1
+    
+    Points --basetemp at /dev/shm on Linux, unless a basetemp was given;
+    elsewhere, or if /dev/shm is not writable, the default is kept.
+    """
+    if (os.environ.get('GUARDIAN_FAST_TMP') != '1' or config.option.basetemp
+            or not sys.platform.startswith('linux')
+            or not os.access('/dev/shm', os.W_OK)):
+        return
+    # pytest empties basetemp on every run, so it must be ours alone
+    config.option.basetemp = f'/dev/shm/pytest-guardian-{os.getuid()}'
+
+class MemoryKeyring(KeyringBackend):
+    """Dict-backed keyring backend"""
+    priority = 1
+    
+    def __init__(self):
+        super().__init__()
+        self._store = {}
+    
+    def set_password(self, service, username, password):
+        self._store[(service, username)] = password
+    
+    def get_password(self, service, username):
+        return self._store.get((service, username))
+    
+    def delete_password(self, service, username):
+        try:
+            del self._store[(service, username)]
+        except KeyError:
+            raise PasswordDeleteError(username)
+
+@pytest.fixture(scope="session", autouse=True)
+def _fake_keyring():
+    """Keep credentials in a dict instead of the OS keyring"""
+    previous = keyring.get_keyring()
+    keyring.set_keyring(MemoryKeyring())
+    yield
+    keyring.set_keyring(previous)
+
+@pytest.fixture(scope="session")
+def memory_keyring():
+    """A private in-memory backend to hand to KeyringManager"""
+    return MemoryKeyring()
+
+FICLONE = 0x40049409  # linux/fs.h
+
+def _clone_file(src, dst):
+    """Share src's data with dst: a reflink where supported, else a copy"""
+    if fcntl is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return dst
+        except OSError:
+            os.unlink(dst)
+    # Never a hard link: a test writing in place would change the skeleton
+    return shutil.copy2(src, dst)
+
+# A small but realistic project: top-level files plus nested packages
+TEMPLATE_FILES = {
+    'python/README.md': '# Test Project',
+    'python/.gitignore': '__pycache__/\n*.pyc\n.venv/\n',
+    'python/pyproject.toml': '[project]\nname = "test-project"\nversion = "0.1.0"\n',
+    'python/src/test_project/__init__.py': '__version__ = "0.1.0"\n',
+    'python/src/test_project/core/__init__.py': '',
+    'python/src/test_project/core/app.py': 'def main():\n    return 0\n',
+    'python/tests/__init__.py': '',
+    'python/tests/test_app.py': (
+        'from test_project.core.app import main\n\n'
+        'def test_main():\n    assert main() == 0\n'
+    ),
+}
+
+@pytest.fixture(scope="session")
+def template_skeleton(tmp_path_factory):
+    """Home directory contents shared by every test, written once"""
+    skeleton = tmp_path_factory.mktemp('skeleton')
+    for name, content in TEMPLATE_FILES.items():
+        path = skeleton / '.guardian' / 'templates' / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return skeleton
+
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_dir(template_skeleton, tmp_path):
+    """Create a temporary directory for testing, seeded from the skeleton"""
+    shutil.copytree(template_skeleton, tmp_path, copy_function=_clone_file,
+                    dirs_exist_ok=True)
+    return tmp_path
 
 @pytest.fixture
 def home_dir(temp_dir):
@@ -39,17 +132,67 @@ def repo_service(home_dir):
     """Provide a clean RepoService instance"""
     return RepoService()
 
+@pytest.fixture(scope="module")
+def security_service(tmp_path_factory):
+    """Provide a SecurityService shared by the module
+    
+    Scans keep no state between calls, and the service only reads HOME
+    while it is built.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('HOME', str(tmp_path_factory.mktemp('home')))
+        return SecurityService()
+
+@pytest.fixture(scope='session')
+def sample_repo_template(tmp_path_factory):
+    """Initialise a git repository once per session"""
+    repo_dir = tmp_path_factory.mktemp('template') / 'sample-repo'
+    repo_dir.mkdir()
+    subprocess.run(
+        ['git', 'init', '-q', '--initial-branch=main'],
+        cwd=repo_dir,
+        check=True
+    )
+    return repo_dir
+
+FAKE_GIT = """\
+#!{python}
+# Stand-in for git: 'init' just creates .git/, anything else runs real git
+import os, pathlib, sys
+args = sys.argv[1:]
+if args[:1] == ['init']:
+    paths = [arg for arg in args[1:] if not arg.startswith('-')]
+    (pathlib.Path(paths[0] if paths else '.') / '.git').mkdir(parents=True, exist_ok=True)
+else:
+    os.execv({git!r}, ['git'] + args)
+"""
+
+@pytest.fixture(scope='session')
+def fake_git_dir(tmp_path_factory):
+    """Directory holding the fake git executable"""
+    bin_dir = tmp_path_factory.mktemp('bin')
+    git = bin_dir / 'git'
+    git.write_text(FAKE_GIT.format(python=sys.executable, git=shutil.which('git')))
+    git.chmod(0o755)
+    return bin_dir
+
 @pytest.fixture
-def security_service(home_dir):
-    """Provide a clean SecurityService instance"""
-    return SecurityService()
+def fake_git(request, monkeypatch):
+    """Put the fake git first on PATH when GUARDIAN_TEST_FAKE_GIT=1
+    
+    Unit tests that only need a repository to exist skip the cost of a
+    real git init; integration tests keep using real git.
+    """
+    if os.environ.get('GUARDIAN_TEST_FAKE_GIT') == '1':
+        bin_dir = request.getfixturevalue('fake_git_dir')
+        monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
 
 @pytest.fixture
-def sample_repo(temp_dir):
-    """Create a sample git repository"""
+def sample_repo(sample_repo_template, temp_dir):
+    """Create a sample git repository
+    
+    Tests that need it as the working directory should use monkeypatch.chdir.
+    """
     repo_dir = temp_dir / 'sample-repo'
-    repo_dir.mkdir()
-    os.chdir(repo_dir)
-    os.system('git init')
+    shutil.copytree(sample_repo_template, repo_dir)
     return repo_dir
-
@@ -1,88 +1,78 @@
 # tests/unit/test_keyring.py
+import os
+import uuid
 import pytest
 from guardian.services.keyring import KeyringManager
 
-@pytest.fixture
-def keyring_manager():
-    return KeyringManager(service_name="guardian-test")
-
-def test_store_and_retrieve_credential(keyring_manager):
-    """Test storing and retrieving a credential"""
-    key = "test-key"
-    value = "test-value"
-    
-    # Store credential
-    result = keyring_manager.store_credential(key, value)
-    assert result.success
+@pytest.fixture(scope="session")
+def keyring_manager(memory_keyring):
+    """One manager over an in-process backend for the whole session
     
-    # Retrieve credential
-    stored_value = keyring_manager.get_credential(key)
-    assert stored_value == value
+    Each pytest-xdist worker gets its own service name, so parallel runs
+    never see each other's entries.
+    """
+    worker = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+    return KeyringManager(service_name=f"guardian-test-{worker}",
+                          backend=memory_keyring)
+
+@pytest.fixture
+def key_factory(request):
+    """Make credential keys unique to the current test"""
+    keys = []
+    def make(name):
+        key = f"{request.node.name}-{uuid.uuid4().hex[:8]}-{name}"
+        keys.append(key)
+        return key
+    make.keys = keys
+    return make
 
-def test_delete_credential(keyring_manager):
-    """Test deleting a credential"""
-    key = "test-key"
-    value = "test-value"
+@pytest.mark.parametrize("op", ["get", "delete", "rotate", "list"])
+def test_credential_lifecycle(keyring_manager, key_factory, op):
+    """Test each operation on a freshly stored credential"""
+    key = key_factory("test-key")
     
     # Store credential
-    keyring_manager.store_credential(key, value)
-    
-    # Delete credential
-    result = keyring_manager.delete_credential(key)
+    result = keyring_manager.store_credential(key, "test-value")
     assert result.success
     
-    # Verify deletion
-    stored_value = keyring_manager.get_credential(key)
-    assert stored_value is None
+    if op == "get":
+        assert keyring_manager.get_credential(key) == "test-value"
+    elif op == "delete":
+        result = keyring_manager.delete_credential(key)
+        assert result.success
+        assert keyring_manager.get_credential(key) is None
+    elif op == "rotate":
+        result = keyring_manager.rotate_credential(key, "new-value")
+        assert result.success
+        assert keyring_manager.get_credential(key) == "new-value"
+    elif op == "list":
+        others = [key_factory("github_token"), key_factory("gpg_key")]
+        with keyring_manager.batch():
+            keyring_manager.store_credential(others[0], "token1")
+            keyring_manager.store_credential(others[1], "key1")
+        result = keyring_manager.list_credentials()
+        assert result.success
+        assert len(result.data['keys']) >= 3
+        assert key in result.data['keys']
+        assert all(other in result.data['keys'] for other in others)
 
-def test_delete_nonexistent_credential(keyring_manager):
+def test_delete_nonexistent_credential(keyring_manager, key_factory):
     """Test deleting a credential that doesn't exist"""
-    result = keyring_manager.delete_credential("nonexistent")
+    result = keyring_manager.delete_credential(key_factory("nonexistent"))
     assert not result.success
     assert "not found" in result.message
 
-def test_list_credentials(keyring_manager):
-    """Test listing credentials"""
-    # Store some test credentials
-    keyring_manager.store_credential("github_token", "token1")
-    keyring_manager.store_credential("gpg_key", "key1")
-    
-    # List credentials
-    result = keyring_manager.list_credentials()
-    assert result.success
-    assert len(result.data['keys']) >= 2
-    assert "github_token" in result.data['keys']
-    assert "gpg_key" in result.data['keys']
-
-def test_rotate_credential(keyring_manager):
-    """Test credential rotation"""
-    key = "test-key"
-    old_value = "old-value"
-    new_value = "new-value"
-    
-    # Store initial credential
-    keyring_manager.store_credential(key, old_value)
-    
-    # Rotate credential
-    result = keyring_manager.rotate_credential(key, new_value)
-    assert result.success
-    
-    # Verify new value
-    stored_value = keyring_manager.get_credential(key)
-    assert stored_value == new_value
-
-def test_rotate_nonexistent_credential(keyring_manager):
+def test_rotate_nonexistent_credential(keyring_manager, key_factory):
     """Test rotating a credential that doesn't exist"""
-    result = keyring_manager.rotate_credential("nonexistent", "new-value")
+    result = keyring_manager.rotate_credential(key_factory("nonexistent"), "new-value")
     assert not result.success
     assert "not found" in result.message
 
 @pytest.fixture(autouse=True)
-def cleanup(keyring_manager):
-    """Clean up any credentials after each test"""
+def cleanup(keyring_manager, key_factory):
+    """Clean up the credentials created by each test"""
     yield
-    for key in ['test-key', 'github_token', 'gpg_key']:
-        try:
-            keyring_manager.delete_credential(key)
-        except:
-            pass
+    # One listing instead of a delete attempt per key, most of them absent
+    existing = set(keyring_manager.list_credentials().data.get('keys', []))
+    for key in existing.intersection(key_factory.keys):
+        keyring_manager.delete_credential(key)
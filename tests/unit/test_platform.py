@@ -0,0 +1,192 @@
+# tests/unit/test_platform.py
+import json
+import subprocess
+import threading
+from datetime import datetime
+import pytest
+import requests
+from guardian.services.migration import MigrationPlan, MigrationResult, PlatformMigration
+from guardian.services.platform import github
+from guardian.services.platform.base import GitPlatform
+from guardian.services.platform.github import GitHubPlatform
+
+def _issue(number, labels=(), assignees=()):
+    """A GitHub issue payload as the REST API returns it"""
+    return {
+        'number': number,
+        'title': f"Issue {number}",
+        'body': None,
+        'state': 'open',
+        'created_at': '2024-01-02T03:04:05Z',
+        'updated_at': '2024-01-03T03:04:05Z',
+        'labels': [{'name': name} for name in labels],
+        'assignees': [{'login': login} for login in assignees],
+        'comments': 2,
+        'node_id': f"I_{number}",
+        'html_url': f"https://github.com/o/r/issues/{number}"
+    }
+
+def _response(payload, status=200, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload).encode()
+    response.headers.update(headers or {})
+    return response
+
+class FakeSession:
+    """Stand-in for requests.Session that serves canned responses by page"""
+
+    def __init__(self, pages, responses=None):
+        self.pages = pages
+        self.responses = list(responses or ())
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, params=None, timeout=None):
+        with self._lock:
+            self.calls.append((method, url, params))
+            if self.responses:
+                return self.responses.pop(0)
+        page = params['page']
+        headers = {}
+        if page == 1 and len(self.pages) > 1:
+            headers['Link'] = f'<{url}?per_page=100&page={len(self.pages)}>; rel="last"'
+        return _response(self.pages[page - 1], headers=headers)
+
+@pytest.fixture
+def platform():
+    """GitHubPlatform whose session is swapped per test"""
+    return GitHubPlatform('test-token')
+
+def test_github_session_pool(platform):
+    """Test the session is authenticated and pools connections"""
+    assert platform.session.headers['Authorization'] == 'Bearer test-token'
+    adapter = platform.session.get_adapter('https://api.github.com')
+    assert adapter._pool_maxsize == GitHubPlatform.MAX_CONCURRENT_PAGES
+
+def test_github_issues_all_pages(platform):
+    """Test every page is fetched and issues keep page order"""
+    platform.session = FakeSession([
+        [_issue(1, labels=['bug'], assignees=['octocat']), _issue(2)],
+        [_issue(3)],
+        [_issue(4)]
+    ])
+    issues = platform.get_issues('o', 'r')
+    assert [issue.id for issue in issues] == ['1', '2', '3', '4']
+    assert issues[0].labels == ['bug']
+    assert issues[0].assignees == ['octocat']
+    assert issues[1].labels == [] and issues[1].description == ''
+    assert issues[0].created_at == datetime(2024, 1, 2, 3, 4, 5)
+    assert sorted(call[2]['page'] for call in platform.session.calls) == [1, 2, 3]
+
+def test_github_pull_requests(platform):
+    """Test pull request payloads are converted"""
+    pull = {
+        **_issue(7),
+        'head': {'ref': 'feature'},
+        'base': {'ref': 'main'},
+        'requested_reviewers': [{'login': 'reviewer'}]
+    }
+    del pull['comments']
+    platform.session = FakeSession([[pull]])
+    (pr,) = platform.get_pull_requests('o', 'r')
+    assert (pr.source_branch, pr.target_branch) == ('feature', 'main')
+    assert pr.reviewers == ['reviewer']
+    assert pr.comments == 0
+
+def test_github_rate_limit_waits_once(platform, monkeypatch):
+    """Test a rate-limited request is retried after the reset"""
+    monkeypatch.setattr(github.time, 'time', lambda: 1000.0)
+    waits = []
+    monkeypatch.setattr(github.time, 'sleep', waits.append)
+    limited = _response({}, status=403, headers={
+        'X-RateLimit-Remaining': '0',
+        'X-RateLimit-Reset': '1005'
+    })
+    platform.session = FakeSession([[_issue(1)]], responses=[limited])
+    assert [issue.id for issue in platform.get_issues('o', 'r')] == ['1']
+    assert waits == [5.0]
+
+def test_github_rate_limit_too_long(platform, monkeypatch):
+    """Test a reset beyond the wait limit raises instead of sleeping"""
+    monkeypatch.setattr(github.time, 'time', lambda: 1000.0)
+    limited = _response({}, status=403, headers={
+        'X-RateLimit-Remaining': '0',
+        'X-RateLimit-Reset': '5000'
+    })
+    platform.session = FakeSession([], responses=[limited])
+    with pytest.raises(requests.HTTPError):
+        platform.get_issues('o', 'r')
+
+@pytest.mark.parametrize("repo", [
+    'owner/name',
+    'https://github.com/owner/name.git',
+    'git@github.com:owner/name.git',
+    'https://gitlab.com/group/owner/name/'
+])
+def test_parse_repo_string(repo):
+    """Test owner and name are read from each reference form"""
+    assert PlatformMigration(None, None)._parse_repo_string(repo) == ('owner', 'name')
+
+class MemoryPlatform(GitPlatform):
+    """Platform holding issues in a list"""
+
+    def __init__(self, issues=(), fail=()):
+        super().__init__('token')
+        self.issues = list(issues)
+        self.fail = set(fail)
+        self.created = []
+
+    def _create_session(self):
+        return None
+
+    def get_issues(self, owner, repo):
+        return self.issues
+
+    def get_pull_requests(self, owner, repo):
+        return []
+
+    def create_issue(self, owner, repo, issue):
+        if issue['title'] in self.fail:
+            raise RuntimeError('rejected')
+        self.created.append((owner, repo, issue['title']))
+
+    def migrate_to(self, target_platform, source_repo, target_repo):
+        return False
+
+def test_migrate_issues(platform):
+    """Test issues are created on the target and failures become warnings"""
+    platform.session = FakeSession([[_issue(n) for n in range(1, 6)]])
+    target = MemoryPlatform(fail={'Issue 3'})
+    plan = MigrationPlan('GitHubPlatform', 'MemoryPlatform', 'o/r', 'team/copy',
+                         {'issues': True}, 0)
+    results = MigrationResult(True, {}, [], [])
+    PlatformMigration(platform, target)._migrate_issues(plan, results)
+    assert results.items_migrated['issues'] == 4
+    assert results.warnings == ['Failed to migrate issue 3: rejected']
+    assert sorted(title for _, _, title in target.created) == [
+        'Issue 1', 'Issue 2', 'Issue 4', 'Issue 5'
+    ]
+    assert {(owner, repo) for owner, repo, _ in target.created} == {('team', 'copy')}
+
+@pytest.mark.slow
+def test_github_migrate_to(platform, tmp_path):
+    """Test code is mirrored and issues follow it to the target"""
+    source = tmp_path / 'owner' / 'source'
+    subprocess.run(['git', 'init', '-q', str(source)], check=True)
+    subprocess.run(
+        ['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com',
+         'commit', '-q', '--allow-empty', '-m', 'initial'],
+        cwd=source, check=True
+    )
+    subprocess.run(['git', '-C', str(source), 'tag', 'v1'], check=True)
+    target = tmp_path / 'team' / 'copy.git'
+    subprocess.run(['git', 'init', '-q', '--bare', str(target)], check=True)
+
+    platform.session = FakeSession([[_issue(1)]])
+    memory = MemoryPlatform()
+    assert platform.migrate_to(memory, str(source), str(target))
+    tags = subprocess.run(['git', '-C', str(target), 'tag'],
+                          capture_output=True, text=True, check=True).stdout
+    assert tags.split() == ['v1']
+    assert memory.created == [('team', 'copy', 'Issue 1')]